@@ -3,15 +3,45 @@ Batch Amazon UK Product Scraper
 Processes multiple products from an Excel file.
 """
 
+import argparse
 import asyncio
+import json
+import os
+import re
 import sys
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
-import pandas as pd
-
+from typing import List, Dict, Any, Optional
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font
+from playwright.async_api import Page
+
+try:
+    from pyexcelerate import Workbook as FastWorkbook
+except ImportError:  # optional: falls back to the streamed openpyxl workbook
+    FastWorkbook = None
+
+from src.admission import AdmissionController
 from src.scraper import AmazonUKScraper
-from src.utils import Logger, load_config, ensure_directories
+from src.utils import (
+    BAR, DASH, Logger, JsonArrayWriter, load_config, save_products_hc,
+    ensure_directories, use_fast_event_loop
+)
+
+
+# A bare 10-character ASIN, and an amazon.com host that should point at amazon.co.uk
+_ASIN_RE = re.compile(r'^[A-Z0-9]{10}$', re.IGNORECASE)
+# (host only, so amazon.com.au / .com.br and paths mentioning amazon.com are left alone)
+_COM_RE = re.compile(r'(?<=//)((?:www\.)?)amazon\.com(?=[/:?#]|$)', re.IGNORECASE)
+_DP_ASIN_RE = re.compile(r'/dp/([A-Z0-9]{10})', re.IGNORECASE)
+
+# Column layout of the batch results workbook; any other keys are appended after these
+_COLUMN_ORDER = ('product_number', 'url', 'product_title',
+                 'price', 'price_type', 'stock_status', 'stock_quantity',
+                 'stock_message', 'scrape_success', 'timestamp',
+                 'error', 'extraction_status')
+_COLUMN_ORDER_SET = frozenset(_COLUMN_ORDER)
 
 
 class BatchScraper:
@@ -22,6 +52,13 @@ class BatchScraper:
         self.logger = Logger()
         self.results = []
         self.output_file = None
+        self._extra_cols = set()
+        self._completed = 0
+        self._unsaved: List[Dict[str, Any]] = []
+        self._asin_cache: Dict[str, Dict[str, Any]] = {}
+        # ASINs being scraped right now; duplicates await the first scrape's result
+        self._asin_inflight: Dict[str, asyncio.Future] = {}
+        self._save_task: Optional[asyncio.Task] = None
 
     def load_urls_from_excel(self, excel_path: str) -> List[str]:
         """
@@ -36,37 +73,61 @@ class BatchScraper:
         try:
             self.logger.info(f"Loading URLs from: {excel_path}")
 
-            # Read Excel file
-            df = pd.read_excel(excel_path)
-
-            # Look for URL column (flexible column name matching)
-            url_column = None
-            for col in df.columns:
-                if 'url' in col.lower() or 'link' in col.lower() or 'asin' in col.lower():
-                    url_column = col
-                    break
-
-            if url_column is None:
-                # If no URL column found, assume first column contains URLs
-                url_column = df.columns[0]
-                self.logger.warning(f"No URL column found. Using first column: {url_column}")
-
-            # Extract URLs and clean them
-            urls = df[url_column].dropna().tolist()
-            urls = [str(url).strip() for url in urls if str(url).strip()]
-
-            # Ensure URLs are proper Amazon UK URLs
+            # Stream the sheet in read-only mode instead of materialising every cell
+            wb = load_workbook(excel_path, read_only=True, data_only=True)
+            try:
+                ws = wb.active
+                rows = ws.iter_rows(values_only=True)
+                header = next(rows, None) or ()
+
+                # Look for URL column (flexible column name matching)
+                url_index = next(
+                    (i for i, col in enumerate(header)
+                     if col is not None and any(k in str(col).lower() for k in ('url', 'link', 'asin'))),
+                    None
+                )
+
+                if url_index is None:
+                    # If no URL column found, assume first column contains URLs
+                    url_index = 0
+                    first_column = header[0] if header else None
+                    self.logger.warning(f"No URL column found. Using first column: {first_column}")
+
+                # Extract URLs, skipping blank cells
+                urls = []
+                for row in rows:
+                    if url_index < len(row) and row[url_index] is not None:
+                        value = str(row[url_index]).strip()
+                        if value:
+                            urls.append(value)
+            finally:
+                wb.close()
+
+            # Ensure URLs are proper Amazon UK URLs (values are already stripped)
             cleaned_urls = []
+            skipped = 0
             for url in urls:
-                url = str(url).strip()
                 # If it's just an ASIN, convert to full URL
-                if not url.startswith('http'):
-                    url = f"https://www.amazon.co.uk/dp/{url}"
+                if _ASIN_RE.match(url):
+                    url = f"https://www.amazon.co.uk/dp/{url.upper()}"
+                elif not url.startswith('http'):
+                    skipped += 1
+                    continue
                 # Ensure it's amazon.co.uk
-                elif 'amazon.com' in url and 'amazon.co.uk' not in url:
-                    url = url.replace('amazon.com', 'amazon.co.uk')
+                else:
+                    url = _COM_RE.sub(r'\1amazon.co.uk', url, count=1)
                 cleaned_urls.append(url)
 
+            if skipped:
+                self.logger.warning(f"Skipped {skipped} values that are neither URLs nor ASINs")
+
+            # Drop duplicate URLs, keeping the first occurrence
+            seen = set()
+            before = len(cleaned_urls)
+            cleaned_urls = [url for url in cleaned_urls if not (url in seen or seen.add(url))]
+            if len(cleaned_urls) < before:
+                self.logger.info(f"Deduplicated {before - len(cleaned_urls)} URLs")
+
             self.logger.success(f"Loaded {len(cleaned_urls)} URLs from Excel file")
             return cleaned_urls
 
@@ -78,120 +139,306 @@ class BatchScraper:
         """
         Scrape all products from the URL list using a SINGLE browser instance.
 
+        Products are fed through a queue to a bounded pool of workers, each
+        borrowing a recycled page from the scraper's page pool.
+
         Args:
             urls: List of product URLs to scrape
         """
         total = len(urls)
-        self.logger.info(f"Starting batch scrape of {total} products")
+        concurrency = max(1, min(int(self.config.get("concurrency", 5)), total or 1))
+        self.logger.info(f"Starting batch scrape of {total} products (concurrency: {concurrency})")
 
         # Create output file path with timestamp
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.output_file = Path("data") / f"batch_results_{timestamp}.xlsx"
         self.logger.info(f"Results will be saved to: {self.output_file}")
+        self.logger.info(f"Progress log: {self.output_file.with_suffix('.jsonl')}")
 
         # Create ONE scraper instance for all products
         scraper = AmazonUKScraper(self.config)
 
-        try:
-            # Initialize browser ONCE
-            self.logger.info("Initializing browser (will be reused for all products)...")
-            await scraper.initialize_browser()
-            self.logger.success("Browser initialized - ready to scrape!")
-
-            for index, url in enumerate(urls, 1):
-                print("\n" + "=" * 80)
-                self.logger.info(f"Processing product {index}/{total}")
-                self.logger.info(f"URL: {url}")
-                print("=" * 80 + "\n")
-
-                try:
-                    # Use fast scraping method (no browser init/close)
-                    product_data = await scraper.scrape_product_fast(url)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, url in enumerate(urls, 1):
+            queue.put_nowait((index, url))
 
-                    # Add index and success indicator
-                    product_data['product_number'] = index
-                    product_data['scrape_success'] = 'error' not in product_data
+        admission = AdmissionController(concurrency)
 
-                    # Store result
-                    self.results.append(product_data)
+        # One slot per product so concurrent workers keep input order
+        self.results = [None] * total
+        self._completed = 0
 
-                    if product_data.get('scrape_success'):
-                        self.logger.success(f"✅ Product {index}/{total} completed successfully")
+        async def worker() -> None:
+            while True:
+                try:
+                    index, url = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                # Different URLs for an ASIN that was already scraped reuse its result
+                match = _DP_ASIN_RE.search(url)
+                asin = match.group(1).upper() if match else None
+                first = self._asin_cache.get(asin)
+                owner = None
+                if first is None and asin:
+                    pending = self._asin_inflight.get(asin)
+                    if pending is not None:
+                        # Another worker is scraping this ASIN; reuse its result
+                        # (None if it failed, in which case scrape it again here)
+                        first = await pending
                     else:
-                        self.logger.error(f"❌ Product {index}/{total} failed: {product_data.get('error', 'Unknown error')}")
+                        owner = self._asin_inflight[asin] = asyncio.get_running_loop().create_future()
+
+                if first is not None:
+                    self.logger.debug("Product %d/%d: ASIN %s already scraped, reusing result", index, total, asin)
+                    cached = dict(first, url=url, product_number=index)
+                    self._record_result(cached)
+                    continue
 
-                    # Save progress after each product
-                    self._save_progress()
+                product_data: Dict[str, Any] = {}
+                try:
+                    async with admission:
+                        async with scraper.page_pool.page() as page:
+                            product_data = await self._scrape_one(scraper, page, index, total, url)
+
+                    if asin and product_data.get('scrape_success'):
+                        self._asin_cache[asin] = product_data
+                finally:
+                    if owner is not None:
+                        del self._asin_inflight[asin]
+                        owner.set_result(product_data if product_data.get('scrape_success') else None)
+
+                # Back off when Amazon starts serving CAPTCHAs
+                if product_data.get('status') == 'captcha' and admission.cap > 1:
+                    await admission.set_cap(max(1, admission.cap // 2))
+                    self.logger.warning(f"CAPTCHA detected - reducing concurrency to {admission.cap}")
 
-                except Exception as e:
-                    self.logger.error(f"❌ Unexpected error processing product {index}/{total}: {e}")
-                    self.results.append({
-                        'product_number': index,
-                        'url': url,
-                        'error': str(e),
-                        'scrape_success': False,
-                        'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                    })
+        try:
+            # Initialize browser ONCE, with one warm page per worker
+            self.logger.info("Initializing browser (will be reused for all products)...")
+            await scraper.initialize_browser(pool_size=concurrency)
+            self.logger.success("Browser initialized - ready to scrape!")
 
-                # No delay - move to next product immediately!
+            workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+            await asyncio.gather(*workers)
 
         finally:
             # Close browser at the end
             self.logger.info("Closing browser...")
             await scraper.close()
+            await self._flush_progress()
+            self._final_save()
 
         self.logger.success(f"\n🎉 Batch scraping completed! Processed {total} products")
         self._print_summary()
         self.logger.success(f"\n📊 Final results saved to: {self.output_file}")
 
-    def _save_progress(self) -> None:
-        """Save current progress to the SAME Excel file (updates with each product)."""
+    async def _scrape_one(self, scraper: AmazonUKScraper, page: Page, index: int, total: int,
+                          url: str) -> Dict[str, Any]:
+        """
+        Scrape a single product on the given page and record the result.
+
+        Args:
+            scraper: Shared scraper owning the browser context
+            page: Playwright page borrowed from the page pool
+            index: 1-based position of the product in the batch
+            total: Total number of products in the batch
+            url: Product URL to scrape
+
+        Returns:
+            The recorded result dictionary
+        """
+        self.logger.debug("[%d/%d] %s", index, total, url)
+
         try:
-            # Convert results to DataFrame
-            df = pd.DataFrame(self.results)
+            # Use fast scraping method (no browser init/close)
+            product_data = await scraper.scrape_product_fast_on_page(page, url)
+
+            # Add index and success indicator
+            product_data.setdefault('url', url)
+            product_data['product_number'] = index
+            product_data['scrape_success'] = 'error' not in product_data
+
+            # Condensed progress: every 10th product at INFO, the rest only when verbose
+            match = _DP_ASIN_RE.search(url)
+            label = match.group(1).upper() if match else url
+            if not product_data.get('scrape_success'):
+                self.logger.error(f"[{index}/{total}] ✗ {label}: {product_data.get('error', 'Unknown error')}")
+            elif index % 10 == 0:
+                self.logger.info(f"[{index}/{total}] ✓ {label}")
+            else:
+                self.logger.debug("[%d/%d] ✓ %s", index, total, label)
+
+        except Exception as e:
+            self.logger.error(f"❌ Unexpected error processing product {index}/{total}: {e}")
+            product_data = {
+                'product_number': index,
+                'url': url,
+                'error': str(e),
+                'scrape_success': False,
+                'timestamp': datetime.now().isoformat(sep=' ', timespec='seconds')
+            }
+
+        self._record_result(product_data)
+        return product_data
+
+    def _record_result(self, product_data: Dict[str, Any]) -> None:
+        """
+        Store a finished product in its slot and append it to the progress log.
+
+        Runs without awaiting, so concurrent workers on the event loop
+        cannot interleave here and no lock is needed.
+
+        Args:
+            product_data: Result dictionary for the product
+        """
+        self.results[product_data['product_number'] - 1] = product_data
+        self._extra_cols.update(product_data.keys() - _COLUMN_ORDER_SET)
+        self._unsaved.append(product_data)
+        self._completed += 1
 
-            # Reorder columns for better readability
-            column_order = ['product_number', 'url', 'product_title',
-                          'price', 'price_type', 'stock_status', 'stock_quantity',
-                          'stock_message', 'scrape_success', 'timestamp',
-                          'error', 'extraction_status']
+        # Checkpoint in a worker thread so the next scrape isn't blocked on disk;
+        # appending JSONL lines is cheap, so every product is logged
+        self._save_progress()
 
-            # Only include columns that exist
-            column_order = [col for col in column_order if col in df.columns]
-            other_columns = [col for col in df.columns if col not in column_order]
-            df = df[column_order + other_columns]
+    def _save_progress(self) -> None:
+        """
+        Schedule a progress checkpoint in a background thread.
+
+        Only one checkpoint runs at a time; if the previous one is still
+        writing, this call is skipped and the next checkpoint catches up.
+        """
+        if self._save_task is not None and not self._save_task.done():
+            return
 
-            # Save to the SAME Excel file (overwrites with updated data)
-            df.to_excel(self.output_file, index=False, engine='openpyxl')
+        snapshot, self._unsaved = tuple(self._unsaved), []
+        self._save_task = asyncio.create_task(asyncio.to_thread(self._save_progress_sync, snapshot))
+
+    async def _flush_progress(self) -> None:
+        """Wait for any in-flight checkpoint, then write whatever it skipped."""
+        if self._save_task is not None:
+            await self._save_task
+        snapshot, self._unsaved = tuple(self._unsaved), []
+        self._save_progress_sync(snapshot)
+
+    def _save_progress_sync(self, new_results: tuple) -> None:
+        """
+        Record the products finished since the previous checkpoint.
+
+        Each new record is appended to a JSONL sidecar, which is the
+        crash-safe progress log while the batch is running, so each call
+        costs O(new rows). The workbook is only built by _final_save().
+
+        Args:
+            new_results: Frozen batch of results not yet checkpointed
+        """
+        try:
+            if not new_results:
+                return
 
-            # Only log every 5 products to reduce console spam
-            if len(self.results) % 5 == 0 or len(self.results) == 1:
-                self.logger.info(f"Progress saved: {len(self.results)} products completed")
+            with open(self.output_file.with_suffix('.jsonl'), 'a', encoding='utf-8') as f:
+                for result in new_results:
+                    f.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+
+            self.logger.debug("Progress saved: %d products completed", self._completed)
 
         except Exception as e:
             self.logger.error(f"Failed to save progress: {e}")
 
+    def _final_save(self) -> None:
+        """
+        Write the results workbook and JSON file to disk once the batch has finished.
+
+        Rows follow input order and include any extra columns. Uses
+        pyexcelerate's bulk sheet writer when it is installed and falls back
+        to a streamed openpyxl write-only workbook otherwise.
+        The JSON array is streamed record by record in input order, or
+        written in the compact homogeneous-collection layout when
+        `compact_json` is enabled.
+        """
+        if self.output_file is None:
+            return
+
+        try:
+            json_path = str(self.output_file.with_suffix('.json'))
+            if self.config.get('compact_json', False):
+                save_products_hc([r for r in self.results if r is not None], json_path)
+            else:
+                with JsonArrayWriter(json_path) as writer:
+                    for result in self.results:
+                        if result is not None:
+                            writer.write(result)
+        except Exception as e:
+            self.logger.error(f"Failed to save results JSON: {e}")
+
+        try:
+            columns = _COLUMN_ORDER + tuple(sorted(self._extra_cols))
+            if FastWorkbook is not None:
+                rows = [list(columns)]
+                rows.extend([result.get(col) for col in columns]
+                            for result in self.results if result is not None)
+                wb = FastWorkbook()
+                wb.new_sheet("Results", data=rows)
+                wb.save(str(self.output_file))
+            else:
+                wb = Workbook(write_only=True)
+                ws = wb.create_sheet("Results")
+                header_font = Font(bold=True)
+                header = []
+                for column in columns:
+                    cell = WriteOnlyCell(ws, value=column)
+                    cell.font = header_font
+                    header.append(cell)
+                ws.append(header)
+                for result in self.results:
+                    if result is not None:
+                        ws.append([result.get(col) for col in columns])
+                wb.save(self.output_file)
+        except Exception as e:
+            self.logger.error(f"Failed to save results workbook: {e}")
+
     def _print_summary(self) -> None:
         """Print summary of batch scraping results."""
-        total = len(self.results)
-        successful = sum(1 for r in self.results if r.get('scrape_success'))
+        total = self._completed
+        successful = sum(1 for r in self.results if r is not None and r.get('scrape_success'))
         failed = total - successful
 
-        print("\n" + "=" * 80)
+        print("\n" + BAR)
         print("BATCH SCRAPING SUMMARY".center(80))
-        print("=" * 80)
+        print(BAR)
         print(f"\nTotal Products:     {total}")
         print(f"✅ Successful:       {successful}")
         print(f"❌ Failed:           {failed}")
-        print(f"Success Rate:       {(successful/total*100):.1f}%")
-        print("\n" + "=" * 80 + "\n")
+        print(f"Success Rate:       {(successful/total*100 if total else 0):.1f}%")
+        print("\n" + BAR + "\n")
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parse command line arguments.
+
+    Returns:
+        Parsed arguments namespace
+    """
+    parser = argparse.ArgumentParser(description="Amazon UK Batch Product Scraper")
+
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log every product and debug details (default: condensed progress)"
+    )
+
+    return parser.parse_args()
 
 
 async def main():
     """Main entry point for batch scraper."""
-    print("\n" + "=" * 80)
+    args = parse_arguments()
+    Logger.configure(verbose=args.verbose)
+
+    print("\n" + BAR)
     print("AMAZON UK BATCH PRODUCT SCRAPER".center(80))
-    print("=" * 80 + "\n")
+    print(BAR + "\n")
 
     # Ensure directories exist
     ensure_directories()
@@ -205,7 +452,10 @@ async def main():
     # Find Excel file in data folder
     logger = Logger()
     data_folder = Path("data")
-    excel_files = list(data_folder.glob("*.xlsx")) + list(data_folder.glob("*.xls"))
+    # scandir entries cache their stat info, so sorting by mtime costs no extra syscalls
+    with os.scandir(data_folder) as it:
+        excel_files = [entry for entry in it
+                       if entry.is_file() and entry.name.lower().endswith(('.xlsx', '.xls'))]
 
     if not excel_files:
         logger.error("No Excel files found in the 'data' folder!")
@@ -215,9 +465,9 @@ async def main():
     # If multiple Excel files, use the most recent one
     if len(excel_files) > 1:
         logger.warning(f"Found {len(excel_files)} Excel files. Using the most recent one.")
-        excel_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
+        excel_files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
 
-    input_file = excel_files[0]
+    input_file = Path(excel_files[0].path)
     logger.info(f"Using Excel file: {input_file.name}")
 
     # Create batch scraper
@@ -231,11 +481,11 @@ async def main():
         return
 
     # Display configuration
-    print("\n" + "-" * 80)
+    print("\n" + DASH)
     logger.info(f"Products to scrape: {len(urls)}")
     logger.info(f"Headless mode: {config.get('headless', False)}")
     logger.info(f"Using cookies: {config.get('use_cookies', True)}")
-    print("-" * 80 + "\n")
+    print(DASH + "\n")
 
     # Start batch scraping
     await batch_scraper.scrape_all_products(urls)
@@ -243,6 +493,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
+        use_fast_event_loop()
         asyncio.run(main())
     except KeyboardInterrupt:
         print("\n\n❌ Scraping interrupted by user")
@@ -15,11 +15,14 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from src.scraper import AmazonUKScraper
 from src.utils import (
+    BAR,
+    DASH,
     Logger,
     load_config,
-    save_to_json,
+    save_to_json_async,
     display_results_table,
-    ensure_directories
+    ensure_directories,
+    use_fast_event_loop
 )
 
 
@@ -92,6 +95,12 @@ Examples:
         help="Path to configuration file (default: config/config.json)"
     )
 
+    parser.add_argument(
+        "--verbose",
+        action="store_true",
+        help="Log step-by-step extraction details (debug output)"
+    )
+
     return parser.parse_args()
 
 
@@ -137,13 +146,14 @@ async def main():
     logger = Logger()
 
     # Print banner
-    print("\n" + "=" * 80)
+    print("\n" + BAR)
     print("AMAZON UK PRODUCT SCRAPER".center(80))
-    print("=" * 80 + "\n")
+    print(BAR + "\n")
 
     try:
         # Parse arguments
         args = parse_arguments()
+        Logger.configure(verbose=args.verbose)
 
         # Ensure directories exist
         ensure_directories()
@@ -166,7 +176,7 @@ async def main():
                 logger.info("Scraping cancelled")
                 return
 
-        print("\n" + "-" * 80 + "\n")
+        print("\n" + DASH + "\n")
 
         # Create scraper instance
         scraper = AmazonUKScraper(config)
@@ -175,12 +185,12 @@ async def main():
         logger.info("Starting scraping process...")
         product_data = await scraper.scrape_product(args.url)
 
-        print("\n" + "-" * 80 + "\n")
+        print("\n" + DASH + "\n")
 
         # Check for errors
         if "error" in product_data:
             logger.error(f"Scraping failed: {product_data.get('error')}")
-            logger.info("Check screenshots folder for debugging information")
+            logger.info("Set \"screenshots\": true in config and rerun to capture debugging screenshots")
             sys.exit(1)
 
         # Display results
@@ -188,7 +198,7 @@ async def main():
 
         # Save to JSON
         output_filename = args.output
-        filepath = save_to_json(product_data, output_filename)
+        filepath = await save_to_json_async(product_data, output_filename)
         logger.success(f"Results saved to: {filepath}")
 
         # Check for missing data
@@ -214,4 +224,5 @@ async def main():
 
 if __name__ == "__main__":
     # Run the async main function
+    use_fast_event_loop()
     asyncio.run(main())
@@ -6,30 +6,11 @@ Tests the problematic product URL.
 import asyncio
 import sys
 
-# Monkey patch the logger to avoid emoji issues
-from src import utils
-
-class SimpleLogger:
-    @staticmethod
-    def info(msg):
-        print(f"[INFO] {msg}")
-
-    @staticmethod
-    def success(msg):
-        print(f"[SUCCESS] {msg}")
-
-    @staticmethod
-    def error(msg):
-        print(f"[ERROR] {msg}")
-
-    @staticmethod
-    def warning(msg):
-        print(f"[WARNING] {msg}")
-
-# Replace the emoji logger
-utils.Logger = SimpleLogger
-
 from src.scraper import AmazonUKScraper
+from src.utils import BAR, Logger
+
+# Plain [LEVEL] prefixes avoid emoji encoding issues on some consoles
+Logger.configure(emoji=False)
 
 async def test_product():
     """Test the specific product that had wrong price."""
@@ -37,17 +18,18 @@ async def test_product():
     # Test Ferrero Rocher - was showing £3.24 (unit price) instead of £17.00
     test_url = "https://amazon.co.uk/dp/B004XAKAYE"
 
-    print("\n" + "="*80)
+    print("\n" + BAR)
     print("TESTING SINGLE PRODUCT - FERRERO ROCHER")
-    print("="*80)
+    print(BAR)
     print(f"URL: {test_url}")
     print("Expected: ~£17.00 (NOT £3.24 unit price!)")
-    print("="*80 + "\n")
+    print(BAR + "\n")
 
     config = {
         "headless": False,  # Set to False so you can see what's happening
         "use_cookies": True,
-        "save_cookies": True
+        "save_cookies": True,
+        "screenshots": True
     }
 
     scraper = AmazonUKScraper(config)
@@ -79,12 +61,12 @@ async def test_product():
         await scraper.take_screenshot("test_product_after_extraction")
 
         # Display results
-        print("\n" + "="*80)
+        print("\n" + BAR)
         print("EXTRACTED DATA")
-        print("="*80)
+        print(BAR)
         for key, value in product_data.items():
             print(f"{key}: {value}")
-        print("="*80)
+        print(BAR)
 
         # Check if price is correct
         extracted_price = product_data.get('price', '')
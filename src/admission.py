@@ -0,0 +1,59 @@
+"""
+Admission control for Amazon UK scraper.
+Caps the number of in-flight scrapes with a limit that can be changed at runtime.
+"""
+
+import asyncio
+
+
+class AdmissionController:
+    """Resizable concurrency limit guarded by an asyncio.Condition."""
+
+    def __init__(self, cap: int):
+        """
+        Initialize the admission controller.
+
+        Args:
+            cap: Maximum number of tasks admitted at once
+        """
+        self._cap = max(1, cap)
+        self._in_flight = 0
+        self._cond = asyncio.Condition()
+
+    @property
+    def cap(self) -> int:
+        """Current concurrency limit."""
+        return self._cap
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free and take it."""
+        async with self._cond:
+            await self._cond.wait_for(lambda: self._in_flight < self._cap)
+            self._in_flight += 1
+
+    async def release(self) -> None:
+        """Give back a slot taken with acquire()."""
+        async with self._cond:
+            self._in_flight -= 1
+            self._cond.notify(1)
+
+    async def set_cap(self, cap: int) -> None:
+        """
+        Change the concurrency limit.
+
+        Raising the cap wakes waiting tasks immediately; lowering it takes
+        effect as in-flight tasks finish.
+
+        Args:
+            cap: New maximum number of tasks admitted at once
+        """
+        async with self._cond:
+            self._cap = max(1, cap)
+            self._cond.notify_all()
+
+    async def __aenter__(self) -> "AdmissionController":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.release()
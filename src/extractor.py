@@ -3,9 +3,256 @@ Data extraction module for Amazon UK product pages.
 Handles extracting product information from parsed HTML.
 """
 
-from typing import Dict, Optional, Any
-from playwright.async_api import Page
-from src.utils import Logger, format_price
+import asyncio
+import functools
+import json
+import re
+from collections import OrderedDict
+from datetime import datetime
+from typing import Dict, List, Optional, Any
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+from playwright.async_api import Error as PlaywrightError, Page
+from src.utils import format_price, get_logger
+
+
+# Query parameters that only track how the page was reached. Variant
+# selectors such as `th` and `psc` pick which SKU is rendered, so they stay.
+_TRACKING_PARAMS = frozenset((
+    "ref", "ref_", "qid", "sr", "keywords", "crid", "sprefix", "dib", "dib_tag",
+    "content-id", "_encoding", "linkCode", "tag", "linkId", "camp", "creative",
+))
+_TRACKING_PREFIXES = ("pd_rd_", "pf_rd_")
+
+# Trailing "/ref=..." path segment Amazon appends to product links
+_REF_PATH_RE = re.compile(r"/ref=[^/]*$")
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Strip tracking query parameters so links to the same product page share a cache key.
+
+    Args:
+        url: Product URL
+
+    Returns:
+        URL without tracking parameters, "/ref=" segment or fragment
+    """
+    parts = urlsplit(url)
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                       if k not in _TRACKING_PARAMS and not k.startswith(_TRACKING_PREFIXES)])
+    path = _REF_PATH_RE.sub("", parts.path)
+    return urlunsplit((parts.scheme, parts.netloc.lower(), path, query, ""))
+
+
+class ProductCache:
+    """LRU cache of extraction results keyed by normalized product URL."""
+
+    def __init__(self, max_size: int = 1000):
+        """
+        Initialize the cache.
+
+        Args:
+            max_size: Number of products kept before the least recently used is evicted
+        """
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a previous extraction for a product URL.
+        Check this before navigating so a hit costs no page traffic at all.
+
+        Args:
+            url: Product URL
+
+        Returns:
+            Copy of the cached data with `url` set to the given URL and
+            `cached` set to True (`timestamp` is when it was actually
+            scraped), or None
+        """
+        cache_key = _normalize_url(url)
+        cached = self._entries.get(cache_key)
+        if cached is None:
+            return None
+        self._entries.move_to_end(cache_key)
+        return dict(cached, url=url, cached=True)
+
+    def put(self, url: str, data: Dict[str, Any]) -> None:
+        """
+        Store a successful extraction.
+
+        Args:
+            url: Product URL the data was scraped from
+            data: Product data returned by extract_all_product_data()
+        """
+        cache_key = _normalize_url(url)
+        self._entries[cache_key] = dict(data)
+        self._entries.move_to_end(cache_key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+# Product title, most specific first
+_TITLE_SELECTORS = (
+    "#productTitle",
+    "h1#title",
+    "h1.product-title",
+    "span#productTitle",
+)
+_TITLE_SELECTOR = ", ".join(_TITLE_SELECTORS)
+
+# Regular price - ORDER MATTERS!
+# More specific selectors first, AVOID .a-text-price as it often matches unit prices
+_REGULAR_PRICE_SELECTORS = (
+    # Primary price display (most reliable)
+    "span.a-price.reinventPricePriceToPayMargin span.a-offscreen",
+    ".a-price.reinventPricePriceToPayMargin .a-offscreen",
+    # Sized price elements (usually main prices, not unit prices)
+    ".a-price[data-a-size='xl'] .a-offscreen",
+    ".a-price[data-a-size='l'] .a-offscreen",
+    ".a-price[data-a-size='medium'] .a-offscreen",
+    ".a-price[data-a-size='large'] .a-offscreen",
+    # Buy box and core price areas (avoid .a-text-price!)
+    "#corePriceDisplay_desktop_feature_div .a-price .a-offscreen",
+    "#corePrice_feature_div .a-price:not(.a-text-price) .a-offscreen",
+    # Legacy selectors
+    "#price_inside_buybox",
+    "#priceblock_ourprice",
+    "#priceblock_dealprice",
+    # Last resort: a-text-price (often unit prices, so check carefully)
+    "#corePrice_feature_div .a-price.a-text-price .a-offscreen",
+    ".a-price.a-text-price .a-offscreen",
+)
+
+# Subscribe & Save price
+# IMPORTANT: Order matters - more specific selectors first
+_SNS_PRICE_SELECTORS = (
+    # Hidden tiered price (needs to be made visible first)
+    "#sns-tiered-price .a-price .a-offscreen",
+    "#sns-tiered-price .a-offscreen",
+    # Main S&S price display area
+    "#rcxsubsync_dealPrice_feature_div .a-price .a-offscreen",
+    "#snsAccordionRowMiddle .a-price .a-offscreen",
+    "#snsAccordionRowMiddle span.a-offscreen",
+    # Base price containers
+    "#sns-base .a-price .a-offscreen",
+    "#sns-base-price",
+    # Accordion sections
+    "#subscriptionAccordion .a-price .a-offscreen",
+    "#rcxsubsToggle .a-price .a-offscreen",
+    # General S&S containers
+    "div[data-feature-name='subscribeAndSave'] .a-price .a-offscreen",
+    "#sns_d_off_pct_label",
+    ".sns-price .a-offscreen",
+)
+
+# Subscribe & Save accordion toggles
+_ACCORDION_SELECTORS = (
+    "a[href='#subscriptionAccordion']",
+    "#rcxsubsToggle",
+    "a.a-link-expander",
+    "button[aria-controls='subscriptionAccordion']",
+)
+
+# For each selector (in priority order) that matches, return the first match's
+# price text and the className of its .a-price container's parent - all in one
+# round-trip instead of several CDP calls per selector
+_SELECTOR_CANDIDATES_JS = """(sels) => {
+    const found = [];
+    for (const s of sels) {
+        const el = document.querySelector(s);
+        if (!el) continue;
+        const off = el.matches('.a-offscreen') ? el : (el.querySelector('.a-offscreen') || el);
+        const container = el.closest('.a-price');
+        found.push({
+            selector: s,
+            text: off.innerText,
+            parentClass: container?.parentElement?.getAttribute('class') || ''
+        });
+    }
+    return found;
+}"""
+
+# Every .a-price on the page with its offscreen text and parent className,
+# those inside the core price / buy box areas first (document order otherwise)
+_ALL_PRICES_JS = """nodes => nodes.map(el => {
+    const off = el.querySelector('.a-offscreen');
+    return {
+        text: off ? off.innerText : null,
+        parentClass: el.parentElement?.getAttribute('class') || '',
+        core: !!el.closest('#corePriceDisplay_desktop_feature_div, #corePrice_feature_div, #buybox')
+    };
+}).sort((a, b) => b.core - a.core)"""
+
+# Prices inside the nearest section/box/div around each "Subscribe & Save" text
+# node, in document order, resolved by a single XPath evaluation
+_SNS_TEXT_PRICES_JS = """() => {
+    const xp = "//text()[contains(normalize-space(.), 'Subscribe & Save')]/.."
+        + "/ancestor-or-self::*[contains(@class, 'a-section') or contains(@class, 'a-box') or self::div][1]"
+        + "//*[contains(concat(' ', normalize-space(@class), ' '), ' a-price ')]"
+        + "//*[contains(concat(' ', normalize-space(@class), ' '), ' a-offscreen ')]";
+    const snapshot = document.evaluate(xp, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const prices = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) {
+        prices.push(snapshot.snapshotItem(i).textContent);
+    }
+    return prices;
+}"""
+
+# True when the page offers Subscribe & Save at all
+_HAS_SNS_JS = """() => !!document.querySelector(
+    "[data-feature-name='subscribeAndSave'], #snsAccordion, #rcxsubsync_dealPrice_feature_div, #sns-base"
+)"""
+
+# Resolves as soon as a Subscribe & Save price node has rendered
+_SNS_PRICE_READY_JS = """() => !!document.querySelector(
+    '#sns-base .a-price .a-offscreen, #snsAccordionRowMiddle .a-offscreen, #sns-tiered-price .a-offscreen'
+)"""
+
+# Candidate lookups with their selector lists baked in once at import
+_REGULAR_PRICE_JS = f"() => ({_SELECTOR_CANDIDATES_JS})({json.dumps(list(_REGULAR_PRICE_SELECTORS))})"
+_SNS_PRICE_JS = f"() => ({_SELECTOR_CANDIDATES_JS})({json.dumps(list(_SNS_PRICE_SELECTORS))})"
+
+# First accordion toggle that mentions Subscribe & Save, or null
+_FIND_ACCORDION_JS = f"""() => {json.dumps(list(_ACCORDION_SELECTORS))}.find(s => {{
+    const el = document.querySelector(s);
+    return el && /subscribe|save/i.test(el.innerText);
+}}) || null"""
+
+# Everything extract_all_product_data reads from the DOM, in a single round-trip
+_SNAPSHOT_JS = f"""() => {{
+    const candidates = {_SELECTOR_CANDIDATES_JS};
+    const title = document.querySelector({json.dumps(_TITLE_SELECTOR)});
+    const hasSns = ({_HAS_SNS_JS})();
+    return {{
+        title: title ? title.innerText : null,
+        hasSns: hasSns,
+        accordion: hasSns ? ({_FIND_ACCORDION_JS})() : null,
+        sns: hasSns ? candidates({json.dumps(list(_SNS_PRICE_SELECTORS))}) : [],
+        snsText: hasSns ? ({_SNS_TEXT_PRICES_JS})() : [],
+        regular: candidates({json.dumps(list(_REGULAR_PRICE_SELECTORS))}),
+        allPrices: ({_ALL_PRICES_JS})(Array.from(document.querySelectorAll('.a-price')))
+    }};
+}}"""
+
+# What the snapshot looks like when the page couldn't be read
+_EMPTY_SNAPSHOT = {
+    "title": None, "hasSns": False, "accordion": None,
+    "sns": [], "snsText": [], "regular": [], "allPrices": [],
+}
+
+# Numeric value of a £ price
+_PRICE_RE = re.compile(r'£(\d+\.?\d*)')
+
+# Unit price markers: "/100g", "/ kg", "per 100g", "/count" and so on
+_UNIT_PRICE_RE = re.compile(r'/ ?(?:100 ?g|kg|g|ml|l)|/(?:count|item|piece)|per (?:100g|kg|g)', re.I)
+
+# Class names that indicate unit prices (PPU = Price Per Unit)
+_UNIT_CLASS_RE = re.compile(r'priceperunit|price-per-unit|apex-price-to-pay-ppu|unit-?price', re.I)
+
+# Stock quantity phrases
+_ONLY_LEFT_RE = re.compile(r'only\s+(\d+)\s+left\s+in\s+stock')
+_QUANTITY_RE = re.compile(r'(\d+)\s+(?:items?|units?)\s+(?:left|in stock|available)')
 
 
 class ProductExtractor:
@@ -19,7 +266,46 @@ class ProductExtractor:
             page: Playwright page object
         """
         self.page = page
-        self.logger = Logger()
+        self.logger = get_logger()
+        # Fences the accordion click so concurrent extractors never race on it
+        self._expand_lock = asyncio.Lock()
+        self._expanded = False
+        self._has_sns: Optional[bool] = None
+
+    async def has_subscribe_save(self) -> bool:
+        """
+        Check whether the product offers Subscribe & Save.
+        The result is remembered for the lifetime of the extractor.
+
+        Returns:
+            True if a Subscribe & Save feature block is on the page
+        """
+        if self._has_sns is None:
+            try:
+                self._has_sns = await self.page.evaluate(_HAS_SNS_JS)
+            except Exception as e:
+                # Can't tell - fall back to the full S&S lookup
+                self.logger.warning(f"Error checking for Subscribe & Save: {e}")
+                return True
+        return self._has_sns
+
+    def _pick_title(self, text: Optional[str]) -> Optional[str]:
+        """
+        Clean up raw title text and log the outcome.
+
+        Args:
+            text: innerText of the title element, or None if it wasn't found
+
+        Returns:
+            Product title string or None if empty
+        """
+        title = text.strip() if text else None
+        if title:
+            self.logger.debug("Product title extracted: %s...", title[:50])
+            return title
+
+        self.logger.error("Could not extract product title")
+        return None
 
     async def extract_product_title(self) -> Optional[str]:
         """
@@ -28,27 +314,105 @@ class ProductExtractor:
         Returns:
             Product title string or None if not found
         """
-        selectors = [
-            "#productTitle",
-            "h1#title",
-            "h1.product-title",
-            "span#productTitle"
-        ]
+        # One selector-list query returns the first match in document order
+        text = None
+        try:
+            element = await self.page.query_selector(_TITLE_SELECTOR)
+            if element:
+                text = await element.inner_text()
+        except Exception as e:
+            self.logger.warning(f"Error extracting title: {e}")
 
-        for selector in selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    title = await element.inner_text()
-                    title = title.strip()
-                    if title:
-                        self.logger.success(f"Product title extracted: {title[:50]}...")
-                        return title
-            except Exception as e:
-                self.logger.warning(f"Error extracting title with selector {selector}: {e}")
-                continue
+        return self._pick_title(text)
 
-        self.logger.error("Could not extract product title")
+    def _pick_selector_price(self, candidates: List[Dict[str, str]], label: str,
+                             check_parent: bool = True) -> Optional[str]:
+        """
+        Return the first candidate that holds a real (non unit) £ price.
+
+        Args:
+            candidates: {selector, text, parentClass} per matching selector, in priority order
+            label: Price name used in log messages
+            check_parent: Also reject candidates whose .a-price parent marks a unit price
+
+        Returns:
+            Price string or None if no candidate qualifies
+        """
+        for candidate in candidates:
+            selector = candidate["selector"]
+            price = format_price(candidate["text"])
+            parent_class = candidate["parentClass"]
+
+            # Validate: must have £ and must NOT be a unit price
+            # Also check the .a-price container's parent for unit price indicators
+            if price and "£" in price:
+                if not self._is_unit_price(price) and not (check_parent and self._is_unit_price_element(parent_class)):
+                    self.logger.debug("%s extracted from %s: %s", label, selector, price)
+                    return price
+                else:
+                    self.logger.debug("Skipping unit price from %s: %s (parent: %.50s)", selector, price, parent_class)
+
+        return None
+
+    def _pick_best_price(self, all_prices: List[Dict[str, Optional[str]]]) -> Optional[str]:
+        """
+        Pick the main price out of every .a-price on the page.
+
+        Args:
+            all_prices: {text, parentClass, core} for each .a-price element, core area first
+
+        Returns:
+            First valid core-area price, else the highest valid price, or None
+        """
+        valid_prices = []
+
+        for candidate in all_prices:
+            price_text = format_price(candidate["text"])
+            parent_class = candidate["parentClass"]
+
+            # Filter out unit prices and invalid prices
+            if (price_text and "£" in price_text and
+                not self._is_unit_price(price_text) and
+                not self._is_unit_price_element(parent_class)):
+
+                # Extract numeric value for comparison
+                match = _PRICE_RE.search(price_text)
+                if match:
+                    numeric_value = float(match.group(1))
+                    # Only consider prices > £1 (most products cost more than £1)
+                    if numeric_value > 1.0:
+                        # The core price block holds the main price - take the first hit
+                        if candidate["core"]:
+                            self.logger.debug("Regular price extracted (core price area): %s", price_text)
+                            return price_text
+                        valid_prices.append((numeric_value, price_text))
+
+        # If we found valid prices, return the highest one (main product price)
+        # Main prices are usually higher than unit prices or promotional snippets
+        if valid_prices:
+            valid_prices.sort(reverse=True)  # Sort by numeric value, descending
+            best_price = valid_prices[0][1]
+            self.logger.debug("Regular price extracted (best match): %s", best_price)
+            return best_price
+
+        return None
+
+    def _pick_sns_text_price(self, prices: List[str]) -> Optional[str]:
+        """
+        Pick the first valid price found next to "Subscribe & Save" text.
+
+        Args:
+            prices: Offscreen price texts in document order
+
+        Returns:
+            Price string or None if there is none
+        """
+        for price in prices:
+            price = format_price(price)
+            # Filter out unit prices here too
+            if price and "£" in price and not self._is_unit_price(price):
+                self.logger.debug("Subscribe & Save price extracted: %s", price)
+                return price
         return None
 
     async def extract_regular_price(self) -> Optional[str]:
@@ -58,101 +422,32 @@ class ProductExtractor:
         Returns:
             Price string or None if not found
         """
-        # Try multiple selectors for regular price - ORDER MATTERS!
-        # More specific selectors first, AVOID .a-text-price as it often matches unit prices
-        selectors = [
-            # Primary price display (most reliable)
-            "span.a-price.reinventPricePriceToPayMargin span.a-offscreen",
-            ".a-price.reinventPricePriceToPayMargin .a-offscreen",
-            # Sized price elements (usually main prices, not unit prices)
-            ".a-price[data-a-size='xl'] .a-offscreen",
-            ".a-price[data-a-size='l'] .a-offscreen",
-            ".a-price[data-a-size='medium'] .a-offscreen",
-            ".a-price[data-a-size='large'] .a-offscreen",
-            # Buy box and core price areas (avoid .a-text-price!)
-            "#corePriceDisplay_desktop_feature_div .a-price .a-offscreen",
-            "#corePrice_feature_div .a-price:not(.a-text-price) .a-offscreen",
-            # Legacy selectors
-            "#price_inside_buybox",
-            "#priceblock_ourprice",
-            "#priceblock_dealprice",
-            # Last resort: a-text-price (often unit prices, so check carefully)
-            "#corePrice_feature_div .a-price.a-text-price .a-offscreen",
-            ".a-price.a-text-price .a-offscreen",
-        ]
+        # Try regular price selectors (ORDER MATTERS - most specific first)
+        try:
+            candidates = await self.page.evaluate(_REGULAR_PRICE_JS)
+        except Exception as e:
+            self.logger.warning(f"Error querying price selectors: {e}")
+            candidates = []
 
-        for selector in selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    price = await element.inner_text()
-                    price = format_price(price)
-
-                    # Validate: must have £ and must NOT be a unit price
-                    # Also check ancestor elements for unit price indicators
-                    if price and "£" in price:
-                        # Get the .a-price container and its parent
-                        price_container = await element.evaluate_handle("el => el.closest('.a-price')")
-                        if price_container:
-                            parent_class = await price_container.evaluate("el => el.parentElement?.className || ''")
-
-                            # Skip if parent or price text indicates this is a unit price
-                            if not self._is_unit_price(price) and not self._is_unit_price_element(parent_class):
-                                self.logger.success(f"Regular price extracted from {selector}: {price}")
-                                return price
-                            else:
-                                self.logger.warning(f"Skipping unit price from {selector}: {price} (parent: {parent_class[:50]})")
-            except Exception as e:
-                self.logger.warning(f"Error with selector {selector}: {e}")
-                continue
+        price = self._pick_selector_price(candidates, "Regular price")
+        if price:
+            return price
 
         # Try alternative approach - collect all prices and filter intelligently
         try:
-            price_divs = await self.page.query_selector_all(".a-price")
-            valid_prices = []
-
-            for price_div in price_divs:
-                try:
-                    # Get the offscreen price (accessible version)
-                    offscreen = await price_div.query_selector(".a-offscreen")
-                    if offscreen:
-                        price_text = await offscreen.inner_text()
-                        price_text = format_price(price_text)
-
-                        # Get parent class to check for unit price indicators
-                        parent_class = await price_div.evaluate("el => el.parentElement?.className || ''")
-
-                        # Filter out unit prices and invalid prices
-                        if (price_text and "£" in price_text and
-                            not self._is_unit_price(price_text) and
-                            not self._is_unit_price_element(parent_class)):
-
-                            # Extract numeric value for comparison
-                            import re
-                            match = re.search(r'£(\d+\.?\d*)', price_text)
-                            if match:
-                                numeric_value = float(match.group(1))
-                                # Only consider prices > £1 (most products cost more than £1)
-                                if numeric_value > 1.0:
-                                    valid_prices.append((numeric_value, price_text))
-                except Exception:
-                    continue
-
-            # If we found valid prices, return the highest one (main product price)
-            # Main prices are usually higher than unit prices or promotional snippets
-            if valid_prices:
-                valid_prices.sort(reverse=True)  # Sort by numeric value, descending
-                best_price = valid_prices[0][1]
-                self.logger.success(f"Regular price extracted (best match): {best_price}")
-                return best_price
-
+            price = self._pick_best_price(await self.page.eval_on_selector_all(".a-price", _ALL_PRICES_JS))
+            if price:
+                return price
         except Exception as e:
             self.logger.warning(f"Error in alternative price extraction: {e}")
 
         self.logger.warning("Could not extract regular price")
         return None
 
-    def _is_unit_price_element(self, parent_class: str) -> bool:
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_unit_price_element(parent_class: str) -> bool:
         """
         Check if a parent element class indicates this is a unit price element.
 
@@ -165,19 +460,11 @@ class ProductExtractor:
         if not parent_class:
             return False
 
-        # Class names that indicate unit prices
-        unit_class_indicators = [
-            'pricePerUnit',
-            'price-per-unit',
-            'apex-price-to-pay-ppu',  # PPU = Price Per Unit
-            'unit-price',
-            'unitPrice'
-        ]
+        return bool(_UNIT_CLASS_RE.search(parent_class))
 
-        parent_lower = parent_class.lower()
-        return any(indicator.lower() in parent_lower for indicator in unit_class_indicators)
-
-    def _is_unit_price(self, price_text: str) -> bool:
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _is_unit_price(price_text: str) -> bool:
         """
         Check if a price string is a unit price (per 100g, per kg, etc.)
 
@@ -190,17 +477,7 @@ class ProductExtractor:
         if not price_text:
             return False
 
-        # Common unit price indicators
-        unit_indicators = [
-            '/100g', '/100 g', '/ 100g', '/ 100 g',
-            '/kg', '/g', '/ kg', '/ g',
-            '/l', '/ml', '/ l', '/ ml',
-            'per 100g', 'per kg', 'per g',
-            '/count', '/item', '/piece'
-        ]
-
-        price_lower = price_text.lower()
-        return any(indicator in price_lower for indicator in unit_indicators)
+        return bool(_UNIT_PRICE_RE.search(price_text))
 
     async def extract_subscribe_save_price(self) -> Optional[str]:
         """
@@ -210,102 +487,72 @@ class ProductExtractor:
         Returns:
             Subscribe & Save price string or None if not found
         """
-        self.logger.info("Attempting to extract Subscribe & Save price...")
+        if not await self.has_subscribe_save():
+            self.logger.debug("Subscribe & Save not offered for this product")
+            return None
+
+        self.logger.debug("Attempting to extract Subscribe & Save price...")
 
         # First, try to click accordion/expandable sections
         await self._try_expand_subscribe_save_section()
 
-        # Wait for any animations/price updates
-        await self.page.wait_for_timeout(500)
-
-        # Try multiple selectors for Subscribe & Save price
-        # IMPORTANT: Order matters - more specific selectors first
-        selectors = [
-            # Hidden tiered price (needs to be made visible first)
-            "#sns-tiered-price .a-price .a-offscreen",
-            "#sns-tiered-price .a-offscreen",
-            # Main S&S price display area
-            "#rcxsubsync_dealPrice_feature_div .a-price .a-offscreen",
-            "#snsAccordionRowMiddle .a-price .a-offscreen",
-            "#snsAccordionRowMiddle span.a-offscreen",
-            # Base price containers
-            "#sns-base .a-price .a-offscreen",
-            "#sns-base-price",
-            # Accordion sections
-            "#subscriptionAccordion .a-price .a-offscreen",
-            "#rcxsubsToggle .a-price .a-offscreen",
-            # General S&S containers
-            "div[data-feature-name='subscribeAndSave'] .a-price .a-offscreen",
-            "#sns_d_off_pct_label",
-            ".sns-price .a-offscreen",
-        ]
+        # Try Subscribe & Save selectors (most specific first)
+        try:
+            candidates = await self.page.evaluate(_SNS_PRICE_JS)
+        except Exception as e:
+            self.logger.warning(f"Error querying Subscribe & Save selectors: {e}")
+            candidates = []
 
-        for selector in selectors:
-            try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    # Check if element is visible or has content
-                    is_visible = await element.is_visible()
-                    price = await element.inner_text()
-                    price = format_price(price)
-
-                    # Even if hidden, extract if it has a valid price
-                    # BUT: Filter out unit prices!
-                    if price and "£" in price and not self._is_unit_price(price):
-                        self.logger.success(f"Subscribe & Save price extracted from {selector}: {price}")
-                        return price
-            except Exception as e:
-                self.logger.warning(f"Error with selector {selector}: {e}")
-                continue
+        # Even if hidden, extract if it has a valid price
+        # BUT: Filter out unit prices!
+        price = self._pick_selector_price(candidates, "Subscribe & Save price", check_parent=False)
+        if price:
+            return price
 
         # Try to find Subscribe & Save text and nearby price
         try:
-            # Look for "Subscribe & Save" text
-            sns_elements = await self.page.query_selector_all("text=Subscribe & Save")
-            for element in sns_elements:
-                # Try to find price near this element
-                parent = await element.evaluate_handle("el => el.closest('.a-section, .a-box, div')")
-                if parent:
-                    price_element = await parent.query_selector(".a-price .a-offscreen")
-                    if price_element:
-                        price = await price_element.inner_text()
-                        price = format_price(price)
-                        # Filter out unit prices here too
-                        if price and "£" in price and not self._is_unit_price(price):
-                            self.logger.success(f"Subscribe & Save price extracted: {price}")
-                            return price
+            price = self._pick_sns_text_price(await self.page.evaluate(_SNS_TEXT_PRICES_JS))
+            if price:
+                return price
         except Exception as e:
             self.logger.warning(f"Error in Subscribe & Save text search: {e}")
 
         self.logger.warning("Subscribe & Save price not found (may not be available for this product)")
         return None
 
-    async def _try_expand_subscribe_save_section(self) -> None:
+    async def _try_expand_subscribe_save_section(self, selector: Optional[str] = None) -> bool:
         """
-        Try to expand Subscribe & Save accordion sections if they exist.
+        Try to expand Subscribe & Save accordion sections if they exist, then wait
+        for the S&S price to render. Only the first call per extractor does any work.
+
+        Args:
+            selector: Accordion toggle already located on the page (looked up if None)
+
+        Returns:
+            True if an accordion was clicked by this call, False otherwise
         """
-        # Possible accordion selectors
-        accordion_selectors = [
-            "a[href='#subscriptionAccordion']",
-            "#rcxsubsToggle",
-            "a.a-link-expander",
-            "button[aria-controls='subscriptionAccordion']"
-        ]
+        async with self._expand_lock:
+            if self._expanded:
+                return False
+            self._expanded = True
 
-        for selector in accordion_selectors:
             try:
-                element = await self.page.query_selector(selector)
-                if element:
-                    # Check if it's related to Subscribe & Save
-                    text = await element.inner_text()
-                    if "subscribe" in text.lower() or "save" in text.lower():
-                        self.logger.info(f"Clicking accordion: {selector}")
-                        await element.click()
-                        await self.page.wait_for_timeout(500)
-                        return
-            except Exception as e:
-                self.logger.warning(f"Could not click accordion {selector}: {e}")
-                continue
+                if selector is None:
+                    selector = await self.page.evaluate(_FIND_ACCORDION_JS)
+                if not selector:
+                    return False
+                self.logger.debug("Clicking accordion: %s", selector)
+                await self.page.click(selector)
+            except PlaywrightError as e:
+                self.logger.debug("Could not click accordion %s: %s", selector, e)
+                return False
+
+        # Wait only as long as it takes for the S&S price node to render
+        try:
+            await self.page.wait_for_function(_SNS_PRICE_READY_JS, timeout=1500)
+        except Exception:
+            self.logger.debug("Subscribe & Save price did not appear after expanding accordion")
+        return True
 
     async def extract_stock_availability(self) -> Dict[str, Any]:
         """
@@ -317,7 +564,7 @@ class ProductExtractor:
             - quantity: Number of items left (if available)
             - message: The raw stock message from Amazon
         """
-        self.logger.info("Extracting stock availability information...")
+        self.logger.debug("Extracting stock availability information...")
 
         stock_info = {
             "status": "unknown",
@@ -337,68 +584,68 @@ class ProductExtractor:
             ".availability-text",
         ]
 
+        # query_selector returns None on a miss; a Playwright failure on one
+        # selector (detached node) only skips that selector
         for selector in stock_selectors:
             try:
                 element = await self.page.query_selector(selector)
-                if element:
-                    stock_text = await element.inner_text()
-                    stock_text = stock_text.strip()
-
-                    if stock_text:
-                        stock_info["message"] = stock_text
-                        self.logger.info(f"Found stock message: {stock_text}")
-
-                        # Analyze stock text to determine status and quantity
-                        stock_text_lower = stock_text.lower()
-
-                        # Check for out of stock
-                        if any(phrase in stock_text_lower for phrase in [
-                            "currently unavailable",
-                            "out of stock",
-                            "not available",
-                            "temporarily out of stock"
-                        ]):
-                            stock_info["status"] = "out_of_stock"
-                            self.logger.warning("Product is OUT OF STOCK")
-                            break
-
-                        # Check for "Only X left in stock" pattern
-                        import re
-                        only_left_match = re.search(r'only\s+(\d+)\s+left\s+in\s+stock', stock_text_lower)
-                        if only_left_match:
-                            quantity = int(only_left_match.group(1))
-                            stock_info["quantity"] = quantity
-                            stock_info["status"] = "low_stock"
-                            self.logger.success(f"Low stock detected: {quantity} items left")
-                            break
-
-                        # Check for general stock quantity pattern
-                        quantity_match = re.search(r'(\d+)\s+(?:items?|units?)\s+(?:left|in stock|available)', stock_text_lower)
-                        if quantity_match:
-                            quantity = int(quantity_match.group(1))
-                            stock_info["quantity"] = quantity
-                            if quantity <= 10:
-                                stock_info["status"] = "low_stock"
-                            else:
-                                stock_info["status"] = "in_stock"
-                            self.logger.success(f"Stock quantity found: {quantity}")
-                            break
-
-                        # Check for "in stock" messages
-                        if any(phrase in stock_text_lower for phrase in [
-                            "in stock",
-                            "available",
-                            "ships from",
-                            "usually dispatches"
-                        ]):
-                            stock_info["status"] = "in_stock"
-                            self.logger.success("Product is IN STOCK")
-                            break
+                stock_text = (await element.inner_text()).strip() if element else ""
+            except PlaywrightError as e:
+                self.logger.debug("Error with stock selector %s: %s", selector, e)
+                continue
 
-            except Exception as e:
-                self.logger.warning(f"Error with stock selector {selector}: {e}")
+            if not stock_text:
                 continue
 
+            stock_info["message"] = stock_text
+            self.logger.debug("Found stock message: %s", stock_text)
+
+            # Analyze stock text to determine status and quantity
+            stock_text_lower = stock_text.lower()
+
+            # Check for out of stock
+            if any(phrase in stock_text_lower for phrase in [
+                "currently unavailable",
+                "out of stock",
+                "not available",
+                "temporarily out of stock"
+            ]):
+                stock_info["status"] = "out_of_stock"
+                self.logger.warning("Product is OUT OF STOCK")
+                break
+
+            # Check for "Only X left in stock" pattern
+            only_left_match = _ONLY_LEFT_RE.search(stock_text_lower)
+            if only_left_match:
+                quantity = int(only_left_match.group(1))
+                stock_info["quantity"] = quantity
+                stock_info["status"] = "low_stock"
+                self.logger.debug("Low stock detected: %s items left", quantity)
+                break
+
+            # Check for general stock quantity pattern
+            quantity_match = _QUANTITY_RE.search(stock_text_lower)
+            if quantity_match:
+                quantity = int(quantity_match.group(1))
+                stock_info["quantity"] = quantity
+                if quantity <= 10:
+                    stock_info["status"] = "low_stock"
+                else:
+                    stock_info["status"] = "in_stock"
+                self.logger.debug("Stock quantity found: %s", quantity)
+                break
+
+            # Check for "in stock" messages
+            if any(phrase in stock_text_lower for phrase in [
+                "in stock",
+                "available",
+                "ships from",
+                "usually dispatches"
+            ]):
+                stock_info["status"] = "in_stock"
+                self.logger.debug("Product is IN STOCK")
+                break
+
         # Additional check: Look for "Add to Basket" button availability
         if stock_info["status"] == "unknown":
             try:
@@ -415,13 +662,13 @@ class ProductExtractor:
                         if is_enabled:
                             stock_info["status"] = "in_stock"
                             stock_info["message"] = "Add to Basket button available"
-                            self.logger.info("Stock inferred from Add to Basket button availability")
+                            self.logger.debug("Stock inferred from Add to Basket button availability")
                             break
                         else:
                             stock_info["status"] = "out_of_stock"
                             stock_info["message"] = "Add to Basket button disabled"
                             break
-            except Exception as e:
+            except PlaywrightError as e:
                 self.logger.warning(f"Error checking basket button: {e}")
 
         if stock_info["status"] == "unknown":
@@ -439,24 +686,52 @@ class ProductExtractor:
         Returns:
             Dictionary containing all extracted product data
         """
-        from datetime import datetime
+        self.logger.debug("Starting product data extraction...")
+
+        # Title, S&S presence and every price candidate come back from a single
+        # evaluate; the stock lookup runs alongside it
+        snapshot, stock_info = await asyncio.gather(
+            self.page.evaluate(_SNAPSHOT_JS),
+            self.extract_stock_availability(),
+            return_exceptions=True
+        )
+        if isinstance(snapshot, Exception):
+            self.logger.warning(f"Error reading product page: {snapshot}")
+            snapshot = _EMPTY_SNAPSHOT
+        if isinstance(stock_info, Exception):
+            self.logger.warning(f"Error extracting stock availability: {stock_info}")
+            stock_info = {"status": "unknown", "quantity": None, "message": None}
+
+        has_sns = self._has_sns = snapshot["hasSns"]
+
+        # Expanding the accordion can reveal the S&S price, so read the page
+        # once more after a click - two round-trips in the worst case
+        if has_sns and snapshot["accordion"]:
+            if await self._try_expand_subscribe_save_section(snapshot["accordion"]):
+                try:
+                    snapshot = await self.page.evaluate(_SNAPSHOT_JS)
+                except Exception as e:
+                    self.logger.warning(f"Error re-reading product page after expanding accordion: {e}")
 
-        self.logger.info("Starting product data extraction...")
+        title = self._pick_title(snapshot["title"])
 
-        # Extract all data
-        title = await self.extract_product_title()
-        subscribe_save_price = await self.extract_subscribe_save_price()
-        stock_info = await self.extract_stock_availability()
+        price = None
+        if has_sns:
+            price = (self._pick_selector_price(snapshot["sns"], "Subscribe & Save price", check_parent=False)
+                     or self._pick_sns_text_price(snapshot["snsText"]))
 
-        # If Subscribe & Save price not found, get one-time purchase price
-        if not subscribe_save_price:
-            self.logger.info("Subscribe & Save price not found, extracting one-time purchase price...")
-            regular_price = await self.extract_regular_price()
-            final_price = regular_price
-            price_type = "One-Time Purchase"
-        else:
-            final_price = subscribe_save_price
+        if price:
+            final_price = price
             price_type = "Subscribe & Save"
+        else:
+            # If Subscribe & Save price not found, use one-time purchase price
+            if has_sns:
+                self.logger.debug("Subscribe & Save price not found, using one-time purchase price")
+            final_price = (self._pick_selector_price(snapshot["regular"], "Regular price")
+                           or self._pick_best_price(snapshot["allPrices"]))
+            if not final_price:
+                self.logger.warning("Could not extract regular price")
+            price_type = "One-Time Purchase"
 
         # Compile results
         data = {
@@ -467,9 +742,9 @@ class ProductExtractor:
             "stock_status": stock_info["status"],
             "stock_quantity": stock_info["quantity"],
             "stock_message": stock_info["message"],
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "timestamp": datetime.now().isoformat(sep=' ', timespec='seconds'),
             "extraction_status": "success" if title else "partial"
         }
 
-        self.logger.success(f"Product data extraction completed - Price Type: {price_type}, Stock: {stock_info['status']}")
+        self.logger.debug("Product data extraction completed - Price Type: %s, Stock: %s", price_type, stock_info['status'])
         return data
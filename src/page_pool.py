@@ -0,0 +1,154 @@
+"""
+Page pool for Amazon UK scraper.
+Keeps a fixed set of warm Playwright pages that are recycled between products.
+"""
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Optional
+from playwright.async_api import BrowserContext, Page
+from src.utils import get_logger
+
+
+class PagePool:
+    """Pre-allocated pool of pages sharing one browser context."""
+
+    def __init__(self, context: BrowserContext, size: int, max_uses: int = 50,
+                 max_age: Optional[float] = None):
+        """
+        Initialize the page pool.
+
+        Args:
+            context: Browser context the pages are opened in
+            size: Number of pages kept in the pool
+            max_uses: Recycle a page after it has served this many products
+            max_age: Recycle a page after this many seconds (None to disable)
+        """
+        self.context = context
+        self.size = size
+        self.max_uses = max_uses
+        self.max_age = max_age
+        self.logger = get_logger()
+        self._idle: asyncio.Queue = asyncio.Queue()
+        self._uses: Dict[Page, int] = {}
+        self._created: Dict[Page, float] = {}
+        self._live = 0
+
+    async def fill(self) -> None:
+        """Open `size` blank pages and make them available for acquire()."""
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._create_page())
+        self.logger.info(f"Page pool ready with {self.size} pages")
+
+    async def _create_page(self) -> Page:
+        """
+        Open a new warm page in the shared context.
+
+        Returns:
+            Playwright page object
+        """
+        page = await self.context.new_page()
+        await page.goto("about:blank")
+        self._live += 1
+        self._uses[page] = 0
+        self._created[page] = time.monotonic()
+        return page
+
+    async def _retire(self, page: Page) -> None:
+        """
+        Close a page and forget its usage counters.
+
+        Args:
+            page: Page to close
+        """
+        if self._uses.pop(page, None) is not None:
+            self._live -= 1
+        self._created.pop(page, None)
+        try:
+            if not page.is_closed():
+                await page.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing pooled page: {e}")
+
+    def _is_worn_out(self, page: Page) -> bool:
+        """
+        Check whether a page has reached its use or age limit.
+
+        Args:
+            page: Page to check
+
+        Returns:
+            True if the page should be replaced, False otherwise
+        """
+        if page.is_closed() or self._uses.get(page, 0) >= self.max_uses:
+            return True
+        if self.max_age is not None:
+            return time.monotonic() - self._created.get(page, 0.0) >= self.max_age
+        return False
+
+    async def acquire(self) -> Page:
+        """
+        Wait for an idle page and take it out of the pool.
+
+        Returns:
+            Playwright page object
+
+        Raises:
+            RuntimeError: If every page has been lost and none could be replaced
+        """
+        page = await self._idle.get()
+        if page is None:
+            # Leave the marker for the other waiters
+            self._idle.put_nowait(None)
+            raise RuntimeError("Page pool has no pages left")
+        return page
+
+    async def release(self, page: Page) -> None:
+        """
+        Return a page to the pool, replacing it if it is worn out.
+
+        Args:
+            page: Page previously obtained from acquire()
+        """
+        self._uses[page] = self._uses.get(page, 0) + 1
+
+        if self._is_worn_out(page):
+            try:
+                fresh = await self._create_page()
+            except Exception as e:
+                self.logger.error(f"Could not replace recycled page: {e}")
+                if not page.is_closed():
+                    # Keep serving from the worn page rather than shrink the pool
+                    self._idle.put_nowait(page)
+                    return
+                await self._retire(page)
+                if self._live <= 0:
+                    # Wake every waiting acquire() instead of leaving it blocked
+                    self._idle.put_nowait(None)
+                return
+            await self._retire(page)
+            page = fresh
+
+        self._idle.put_nowait(page)
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Borrow a page for the duration of an `async with` block.
+
+        Yields:
+            Playwright page object, released back to the pool on exit
+        """
+        page = await self.acquire()
+        try:
+            yield page
+        finally:
+            await self.release(page)
+
+    async def close(self) -> None:
+        """Close every idle page in the pool."""
+        while not self._idle.empty():
+            page = self._idle.get_nowait()
+            if page is not None:
+                await self._retire(page)
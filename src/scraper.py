@@ -1,52 +1,282 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 import asyncio
-from playwright.async_api import async_playwright, Browser, Page, BrowserContext
-from src.utils import Logger, random_delay, save_cookies, load_cookies
-from src.extractor import ProductExtractor
+import hashlib
+import json
+import random
+import re
+import time
+from playwright.async_api import async_playwright, Browser, Page, BrowserContext, Route
+from src.utils import (
+    get_logger, save_cookies, flush_cookies, load_cookies, load_location_cache, save_location_cache
+)
+from src.extractor import ProductCache, ProductExtractor
+from src.page_pool import PagePool
+
+
+# Anti-detection patches run before any page script, installed once per context
+_INIT_SCRIPT = """
+Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+Object.defineProperty(navigator, 'plugins', {get: () => [1, 2, 3, 4, 5]});
+Object.defineProperty(navigator, 'languages', {get: () => ['en-GB', 'en']});
+window.chrome = window.chrome || {runtime: {}};
+"""
+
+# Chromium flags: hide automation, plus switch off features a DOM scraper never
+# uses (GPU, extensions, sync, translate, background updates) to cut startup
+# time and per-page memory. Overridable with the "browser_args" config option.
+_BROWSER_ARGS = (
+    "--disable-blink-features=AutomationControlled",
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-translate",
+    "--disable-default-apps",
+    "--disable-features=TranslateUI,BlinkGenPropertyTrees,IsolateOrigins,site-per-process",
+    "--disable-component-update",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--mute-audio",
+)
+
+# Minimum gap (seconds, randomized) between the starts of two Amazon navigations
+_REQUEST_SPACING = (0.3, 0.8)
+_rng = random.Random()
+
+# Requests a HAR cache may replay: Amazon's static CDN scripts only. Product
+# documents and XHR (where prices live) always go to the network.
+_HAR_URL_PATTERN = re.compile(r"^https://(m\.media-amazon\.com|images-[a-z]+\.ssl-images-amazon\.com)/.*\.js(\?|$)")
+
+# Subresources the scraper never reads - aborted when block_resources is on
+_BLOCKED_RESOURCE_TYPES = frozenset(("image", "media", "font", "stylesheet"))
+
+# Ad and tracking hosts aborted along with them
+_BLOCKED_HOSTS = ("amazon-adsystem", "doubleclick", "googletagmanager", "fls-eu.amazon")
+
+# Location flow elements
+_DELIVER_TO_SELECTOR = "#nav-global-location-popover-link"
+_POSTCODE_INPUT_SELECTOR = "#GLUXZipUpdateInput"
+_APPLY_SELECTOR = 'input[aria-labelledby="GLUXZipUpdate-announce"]'
+_LOCATION_LINE_SELECTOR = "#glow-ingress-line2"
+
+# Attempts per location-change step before giving up
+_LOCATION_MAX_ATTEMPTS = 3
+
+# Continue/Done buttons that can follow Apply in the location popover
+# (Playwright CSS allows :has-text inside a selector list)
+_CONTINUE_SELECTOR = ", ".join((
+    "button[name='glowDoneButton']",
+    "button:has-text('Done')",
+    "button:has-text('Continue')",
+    "#GLUXConfirmClose",
+))
+
+# Common selectors for Subscribe & Save button/radio
+# Try radio buttons first, then labels
+_SNS_OPTION_SELECTORS = (
+    # Radio button inputs
+    "#rcxsubsync_dealPrice_feature_div input[type='radio']",
+    "input#rcxsubsRadioButton",
+    "#subscribe-and-save-radio-button",
+    "input[name='submit.addToCart'][value*='subscribe']",
+    # Labels (more reliable for clicking)
+    "#rcxsubsync_dealPrice_feature_div label",
+    "label[for='rcxsubsRadioButton']",
+    "label[for='subscribe-and-save-radio-button']",
+    # Other selectors
+    "[data-action='rc-subscribe-radio-button']",
+    ".rcx-radio__label",
+)
+
+# Main displayed price, which switches to the S&S price once that option is selected
+_CORE_PRICE_SELECTOR = "#corePriceDisplay_desktop_feature_div .a-offscreen, #corePrice_feature_div .a-offscreen"
+
+# Price/buy-box containers the extractor snapshot reads its prices from
+_PRICE_CONTAINER_SELECTOR = "#corePriceDisplay_desktop_feature_div, #corePrice_feature_div, #buybox"
+
+# Finds the first visible S&S control (priority order) and, unless its radio is
+# already checked, clicks it - all inside the page. Returns null while nothing
+# matches, so wait_for_function keeps polling until the widget renders.
+_SNS_SELECT_JS = f"""() => {{
+    for (const s of {json.dumps(list(_SNS_OPTION_SELECTORS))}) {{
+        const el = document.querySelector(s);
+        if (!el || !el.getClientRects().length) continue;
+        if ((el.control || el).checked === true) return {{state: 'already'}};
+        const core = document.querySelector({_CORE_PRICE_SELECTOR!r});
+        const price = core ? core.textContent : null;
+        el.click();
+        return {{state: 'clicked', selector: s, price: price}};
+    }}
+    return null;
+}}"""
+
+# True once the core price text differs from the argument
+_PRICE_CHANGED_JS = f"""(before) => {{
+    const el = document.querySelector({_CORE_PRICE_SELECTOR!r});
+    return !!el && el.textContent !== before;
+}}"""
+
+# Cookies that identify an amazon.co.uk browser session
+_SESSION_COOKIES = ("ubid-acbuk", "session-id")
+
+
+def _session_key(cookies: List[Dict[str, Any]]) -> Optional[str]:
+    """
+    Hash the session-identifying cookies into a postcode cache key.
+
+    Args:
+        cookies: Cookies from the browser context
+
+    Returns:
+        Hex digest, or None if the session cookies aren't set yet
+    """
+    values = {c["name"]: c["value"] for c in cookies if c["name"] in _SESSION_COOKIES}
+    if len(values) < len(_SESSION_COOKIES):
+        return None
+    return hashlib.sha1("|".join(values[name] for name in _SESSION_COOKIES).encode()).hexdigest()
+
+
+# True once the header shows the postcode area passed as the argument
+_LOCATION_SHOWN_JS = f"""(area) => {{
+    const line = document.querySelector({_LOCATION_LINE_SELECTOR!r});
+    return !!line && line.textContent.toUpperCase().includes(area);
+}}"""
+
+# True once Apply has been handled: the header already shows the postcode
+# area, or the popover is asking for Continue/Done
+_LOCATION_APPLIED_JS = f"""(area) => ({_LOCATION_SHOWN_JS})(area)
+    || !!document.querySelector("button[name='glowDoneButton'], #GLUXConfirmClose")
+    || Array.from(document.querySelectorAll('.a-popover button')).some(b => /Done|Continue/.test(b.textContent))"""
+
+
+def _no_log(message: str, *args: Any) -> None:
+    """Stand-in for a Logger method when that output is switched off."""
 
 
 class AmazonUKScraper:
     def __init__(self, config: Dict[str, Any]):
         self.config = config
-        self.logger = Logger()
+        self.logger = get_logger()
         self.browser: Optional[Browser] = None
         self.context: Optional[BrowserContext] = None
         self.page: Optional[Page] = None
+        self.page_pool: Optional[PagePool] = None
         self.playwright = None
+        # Products already extracted in this session, so repeat URLs skip the page load
+        self._product_cache = ProductCache()
+        # Debug screenshots are off unless asked for; they cost a repaint + PNG encode each
+        self.screenshots_enabled = config.get("screenshots", False)
+        self._screenshot_tasks: set = set()
+        # Background cookie write, started after scraping and awaited by close()
+        self._cookie_task: Optional[asyncio.Task] = None
+        self._scrapes_since_cookie_save = 0
+        # Set when a save was requested while another was still running
+        self._cookie_save_pending = False
+        # Per-domain pacing: cap concurrent Amazon navigations and space their
+        # starts with a little jitter, so bursts don't trigger 503s/CAPTCHAs
+        self._domain_limiter = asyncio.Semaphore(config.get("amazon_concurrency", 4))
+        self._pace_lock = asyncio.Lock()
+        self._last_request_ts = 0.0
+        # Step-by-step progress lines; quiet_per_step drops them at the call site
+        self._step_log = _no_log if config.get("quiet_per_step", False) else self.logger.info
+
+    async def __aenter__(self) -> "AmazonUKScraper":
+        """
+        Start a long-lived session: launch the browser once and set the
+        delivery location, so every page opened afterwards inherits it.
 
-    async def initialize_browser(self) -> None:
+        Example:
+            async with AmazonUKScraper(config) as scraper:
+                results = [await scraper.scrape_url(url) for url in urls]
+        """
+        await self.initialize_browser()
+
+        postcode = self.config.get("postcode")
+        if postcode and not await self._location_already_set(postcode):
+            if await self.change_location_to_uk(postcode):
+                await self._remember_location(postcode)
+            else:
+                self.logger.warning("Could not set delivery location, continuing with default")
+
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Save cookies (if enabled) and close the session."""
+        self._schedule_cookie_save()
+        await self.close()
+
+    async def _persist_cookies(self) -> None:
+        """Read the context's cookies and write them to disk off the event loop."""
+        try:
+            cookies = await self.context.cookies()
+            await asyncio.to_thread(save_cookies, cookies)
+        except Exception as e:
+            self.logger.warning(f"Could not save cookies: {e}")
+
+    def _schedule_cookie_save(self) -> None:
+        """
+        Start saving cookies in the background (if enabled). If a save is
+        already in progress it is left to finish and close() takes one more
+        snapshot afterwards, so later cookie changes aren't lost.
+        """
+        if not self.context or not self.config.get("save_cookies", True):
+            return
+        self._scrapes_since_cookie_save = 0
+        if self._cookie_task is None or self._cookie_task.done():
+            self._cookie_task = asyncio.create_task(self._persist_cookies())
+        else:
+            self._cookie_save_pending = True
+
+    async def initialize_browser(self, pool_size: int = 0) -> None:
         """
         Initialize the Playwright browser with anti-detection measures.
+
+        Args:
+            pool_size: Number of warm pages to pre-open in self.page_pool
+                       for concurrent scraping (0 disables the pool)
         """
         self.logger.info("Initializing browser...")
 
         self.playwright = await async_playwright().start()
 
-        # Launch browser with specific settings
-        self.browser = await self.playwright.chromium.launch(
+        # Browser settings plus context settings with anti-detection measures
+        launch_options = dict(
             headless=self.config.get("headless", False),
-            args=[
-                "--disable-blink-features=AutomationControlled",
-                "--no-sandbox",
-                "--disable-dev-shm-usage"
-            ]
+            args=list(self.config.get("browser_args", _BROWSER_ARGS))
         )
-
-        # Create context with anti-detection measures
-        self.context = await self.browser.new_context(
-            viewport={"width": 1280, "height": 800},
+        context_options = dict(
+            viewport={"width": 1024, "height": 768},
             locale="en-GB",
             timezone_id="Europe/London",
             user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
         )
 
+        profile_dir = self.config.get("profile_dir", ".playwright_profile")
+        if profile_dir:
+            # Persistent profile: the HTTP cache (Amazon's static JS) survives between runs.
+            # Only one process can use a profile directory at a time.
+            self.context = await self.playwright.chromium.launch_persistent_context(
+                user_data_dir=str(Path(profile_dir)), **launch_options, **context_options
+            )
+            self.browser = self.context.browser  # None for persistent contexts
+        else:
+            self.browser = await self.playwright.chromium.launch(**launch_options)
+            self.context = await self.browser.new_context(**context_options)
+
         # Disable webdriver detection
-        await self.context.add_init_script("""
-            Object.defineProperty(navigator, 'webdriver', {
-                get: () => undefined
-            });
-        """)
+        await self.context.add_init_script(_INIT_SCRIPT)
+
+        # Only documents, scripts and XHR/fetch are needed to read the DOM
+        if self.config.get("block_resources", True):
+            await self.context.route("**/*", self._block_heavy_resources)
+
+        # Replay Amazon's static scripts from a recorded HAR, recording it on the first run
+        har_path = self.config.get("har_cache")
+        if har_path:
+            await self._route_from_har_cache(Path(har_path))
 
         # Load cookies if they exist
         if self.config.get("use_cookies", True):
@@ -54,26 +284,124 @@ class AmazonUKScraper:
             if cookies:
                 await self.context.add_cookies(cookies)
 
-        self.page = await self.context.new_page()
+        # A persistent context opens with a blank page already - use it
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+
+        if pool_size > 0:
+            self.page_pool = PagePool(
+                self.context,
+                pool_size,
+                max_uses=self.config.get("page_max_uses", 50),
+                max_age=self.config.get("page_max_age")
+            )
+            await self.page_pool.fill()
 
         self.logger.success("Browser initialized successfully")
 
+    async def _location_already_set(self, postcode: str) -> bool:
+        """
+        Check whether the replayed cookies belong to a session whose delivery
+        location was already set to this postcode.
+
+        Args:
+            postcode: Postcode the location should be set to
+
+        Returns:
+            True if the location change can be skipped, False otherwise
+        """
+        key = _session_key(await self.context.cookies("https://www.amazon.co.uk"))
+        if key and load_location_cache().get(key) == postcode:
+            self.logger.success(f"Delivery location already set to {postcode} (saved session)")
+            return True
+        return False
+
+    async def _remember_location(self, postcode: str) -> None:
+        """
+        Record the postcode for the current cookie session so later runs can skip
+        the location change.
+
+        Args:
+            postcode: Postcode the location was set to
+        """
+        key = _session_key(await self.context.cookies("https://www.amazon.co.uk"))
+        if key:
+            save_location_cache(key, postcode)
+            # Persist the cookies now so the cache and cookie file agree
+            self._schedule_cookie_save()
+
+    async def _goto(self, page: Page, url: str, **kwargs: Any) -> None:
+        """
+        Navigate to an Amazon URL under the per-domain rate limit.
+
+        Args:
+            page: Page to navigate
+            url: URL to load
+            **kwargs: Passed through to page.goto()
+        """
+        async with self._domain_limiter:
+            async with self._pace_lock:
+                wait = self._last_request_ts + _rng.uniform(*_REQUEST_SPACING) - time.monotonic()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                self._last_request_ts = time.monotonic()
+            await page.goto(url, **kwargs)
+
+    async def _route_from_har_cache(self, har_path: Path) -> None:
+        """
+        Serve static scripts from a HAR file, or record one if it doesn't exist yet.
+        Anything missing from the HAR falls through to the network.
+
+        Args:
+            har_path: HAR file to replay from / record into (written when the context closes)
+        """
+        try:
+            if har_path.exists():
+                await self.context.route_from_har(har_path, url=_HAR_URL_PATTERN, not_found="fallback")
+                self.logger.info(f"Replaying static resources from {har_path}")
+            else:
+                har_path.parent.mkdir(parents=True, exist_ok=True)
+                await self.context.route_from_har(har_path, url=_HAR_URL_PATTERN, update=True)
+                self.logger.info(f"Recording static resources to {har_path}")
+        except Exception as e:
+            self.logger.warning(f"HAR cache unavailable, using the network: {e}")
+
+    async def _block_heavy_resources(self, route: Route) -> None:
+        """
+        Abort images, media, fonts, stylesheets and ad/tracking requests.
+
+        Args:
+            route: Intercepted request route
+        """
+        request = route.request
+        if (request.resource_type in _BLOCKED_RESOURCE_TYPES or
+                any(host in request.url for host in _BLOCKED_HOSTS)):
+            await route.abort()
+        else:
+            await route.continue_()
+
     async def take_screenshot(self, name: str) -> str:
         """
-        Take a screenshot of the current page.
+        Take a viewport screenshot of the current page in the background.
+        Does nothing unless the "screenshots" config option is enabled.
 
         Args:
             name: Name for the screenshot file
 
         Returns:
-            Path to the saved screenshot
+            Path the screenshot is written to, or "" if screenshots are disabled
         """
+        if not self.screenshots_enabled:
+            return ""
+
         screenshots_dir = Path("screenshots")
         screenshots_dir.mkdir(exist_ok=True)
 
+        # Encode and write while the flow carries on; close() waits for stragglers
         filepath = screenshots_dir / f"{name}.png"
-        await self.page.screenshot(path=str(filepath), full_page=True)
-        self.logger.info(f"Screenshot saved: {filepath}")
+        task = asyncio.create_task(self.page.screenshot(path=str(filepath), full_page=False))
+        self._screenshot_tasks.add(task)
+        task.add_done_callback(self._screenshot_tasks.discard)
+        self._step_log("Screenshot saved: %s", filepath)
         return str(filepath)
 
     async def change_location_to_uk(self, postcode: str = "SW5 9FE") -> bool:
@@ -81,6 +409,9 @@ class AmazonUKScraper:
         Change Amazon location to UK with specified postcode.
         This is the CRITICAL function that must work reliably.
 
+        Each step is retried on its own with exponential backoff, so a flaky
+        popup doesn't throw away the steps that already succeeded.
+
         Args:
             postcode: UK postcode to set (default: "SE1 1")
 
@@ -89,233 +420,287 @@ class AmazonUKScraper:
         """
         self.logger.info(f"Starting location change process to postcode: {postcode}")
 
+        steps = (
+            self._location_open_homepage,
+            self._location_open_popup,
+            self._location_enter_postcode,
+            self._location_apply,
+        )
+
         try:
-            # Step 1: Navigate to Amazon UK homepage
-            self.logger.info("Step 1: Navigating to Amazon.co.uk...")
-            await self.page.goto("https://www.amazon.co.uk", wait_until="domcontentloaded")
-            await random_delay(2, 3)
-            await self.take_screenshot("01_before_location_change")
-            self.logger.success("Loaded Amazon UK homepage")
+            step, failures = 0, 0
+            while step < len(steps):
+                if await steps[step](postcode):
+                    # Each step gets its own attempt budget
+                    step, failures = step + 1, 0
+                    continue
 
-            # Step 2: Click the "Deliver to" button
-            self.logger.info("Step 2: Clicking 'Deliver to' button...")
-            deliver_to_selector = "#nav-global-location-popover-link"
+                failures += 1
+                if failures >= _LOCATION_MAX_ATTEMPTS:
+                    self.logger.error(f"Location change failed: step {step + 1} failed {failures} times")
+                    return False
+                delay = 0.5 * 2 ** (failures - 1)
+                self.logger.warning(f"Retrying step {step + 1} in {delay:.1f}s (attempt {failures + 1}/{_LOCATION_MAX_ATTEMPTS})")
+                await asyncio.sleep(delay)
 
-            try:
-                await self.page.wait_for_selector(deliver_to_selector, timeout=5000)
-                await self.page.click(deliver_to_selector)
-                self.logger.success("Clicked 'Deliver to' button")
-            except Exception as e:
-                self.logger.error(f"Failed to click 'Deliver to' button: {e}")
-                await self.take_screenshot("error_deliver_to_button")
-                return False
+            await self._location_confirm()
 
-            # Step 3: Wait for location popup to appear
-            self.logger.info("Step 3: Waiting for location popup...")
-            await random_delay(1, 2)
+            # Step 7: Verify location change
+            self._step_log("Step 7: Verifying location change...")
+            return await self._verify_location_change(postcode)
 
-            try:
-                await self.page.wait_for_selector("#GLUXZipUpdateInput", timeout=1000)
-                await self.take_screenshot("02_popup_appeared")
-                self.logger.success("Location popup appeared")
-            except Exception as e:
-                self.logger.error(f"Location popup did not appear: {e}")
-                await self.take_screenshot("error_no_popup")
-                return False
+        except Exception as e:
+            self.logger.error(f"Unexpected error during location change: {e}")
+            await self.take_screenshot("error_unexpected")
+            return False
 
-            # Step 4: Enter postcode
-            self.logger.info(f"Step 4: Entering postcode '{postcode}'...")
-            postcode_input_selector = "#GLUXZipUpdateInput"
+    async def _location_open_homepage(self, postcode: str) -> bool:
+        """
+        Step 1: Navigate to Amazon UK homepage.
 
-            try:
-                # Clear any existing value first
-                await self.page.fill(postcode_input_selector, "")
-                await random_delay(0.5, 1)
-
-                # Type the postcode
-                await self.page.fill(postcode_input_selector, postcode)
-                await random_delay(0.5, 1)
-                await self.take_screenshot("03_postcode_entered")
-                self.logger.success(f"Postcode '{postcode}' entered")
-            except Exception as e:
-                self.logger.error(f"Failed to enter postcode: {e}")
-                await self.take_screenshot("error_postcode_entry")
-                return False
+        Args:
+            postcode: Postcode being set (unused, keeps the step signature uniform)
 
-            # Step 5: Click Apply button
-            self.logger.info("Step 5: Clicking Apply button...")
-            apply_button_selector = 'input[aria-labelledby="GLUXZipUpdate-announce"]'
+        Returns:
+            True if the homepage loaded, False otherwise
+        """
+        self._step_log("Step 1: Navigating to Amazon.co.uk...")
+        try:
+            await self._goto(self.page, "https://www.amazon.co.uk", wait_until="domcontentloaded")
+        except Exception as e:
+            self.logger.error(f"Failed to load Amazon UK homepage: {e}")
+            return False
+        await self.take_screenshot("01_before_location_change")
+        self.logger.success("Loaded Amazon UK homepage")
+        return True
 
-            try:
-                await self.page.wait_for_selector(apply_button_selector, timeout=1000)
-                await self.page.click(apply_button_selector)
-                self.logger.success("Clicked Apply button")
-                await random_delay(2, 3)
-            except Exception as e:
-                self.logger.error(f"Failed to click Apply button: {e}")
-                await self.take_screenshot("error_apply_button")
-                return False
+    async def _location_open_popup(self, postcode: str) -> bool:
+        """
+        Steps 2-3: Click the "Deliver to" button and wait for the location popup.
 
-            # Step 6: Check if Continue/Done button appears and click it
-            self.logger.info("Step 6: Checking for Continue/Done button...")
+        Args:
+            postcode: Postcode being set (unused, keeps the step signature uniform)
 
-            continue_selectors = [
-                "button[name='glowDoneButton']",
-                "button:has-text('Done')",
-                "button:has-text('Continue')",
-                "#GLUXConfirmClose"
-            ]
+        Returns:
+            True if the popup is open, False otherwise
+        """
+        # On a retry the popup may already be open - clicking again would close it
+        if await self.page.is_visible(_POSTCODE_INPUT_SELECTOR):
+            return True
 
-            for selector in continue_selectors:
-                try:
-                    element = await self.page.wait_for_selector(selector, timeout=1000)
-                    if element:
-                        await element.click()
-                        self.logger.success(f"Clicked Continue/Done button: {selector}")
-                        await random_delay(2, 3)
-                        break
-                except Exception:
-                    continue
+        self._step_log("Step 2: Clicking 'Deliver to' button...")
 
-            await self.take_screenshot("04_after_apply")
+        try:
+            await self.page.wait_for_selector(_DELIVER_TO_SELECTOR, timeout=5000)
+            await self.page.click(_DELIVER_TO_SELECTOR)
+            self.logger.success("Clicked 'Deliver to' button")
+        except Exception as e:
+            self.logger.error(f"Failed to click 'Deliver to' button: {e}")
+            await self.take_screenshot("error_deliver_to_button")
+            return False
 
-            # Step 7: Verify location change
-            self.logger.info("Step 7: Verifying location change...")
-            return await self._verify_location_change(postcode)
+        self._step_log("Step 3: Waiting for location popup...")
 
+        try:
+            await self.page.wait_for_selector(_POSTCODE_INPUT_SELECTOR, timeout=3000)
+            await self.take_screenshot("02_popup_appeared")
+            self.logger.success("Location popup appeared")
+            return True
         except Exception as e:
-            self.logger.error(f"Unexpected error during location change: {e}")
-            await self.take_screenshot("error_unexpected")
+            self.logger.error(f"Location popup did not appear: {e}")
+            await self.take_screenshot("error_no_popup")
             return False
 
-    async def _verify_location_change(self, expected_postcode: str) -> bool:
+    async def _location_enter_postcode(self, postcode: str) -> bool:
         """
-        Verify that the location was actually changed.
+        Step 4: Enter the postcode into the popup.
 
         Args:
-            expected_postcode: The postcode that should be set
+            postcode: Postcode to enter
 
         Returns:
-            True if location is verified, False otherwise
+            True if the postcode was entered, False otherwise
         """
+        self._step_log("Step 4: Entering postcode '%s'...", postcode)
+
         try:
-            # Wait for page to update
-            await random_delay(2, 3)
+            # fill() replaces any existing value in one step
+            await self.page.fill(_POSTCODE_INPUT_SELECTOR, postcode)
+            await self.take_screenshot("03_postcode_entered")
+            self.logger.success(f"Postcode '{postcode}' entered")
+            return True
+        except Exception as e:
+            self.logger.error(f"Failed to enter postcode: {e}")
+            await self.take_screenshot("error_postcode_entry")
+            return False
 
-            # Check the delivery location text
-            location_selector = "#glow-ingress-line2"
-            await self.page.wait_for_selector(location_selector, timeout=10000)
+    async def _location_apply(self, postcode: str) -> bool:
+        """
+        Step 5: Click Apply and wait for Amazon to react.
 
-            location_text = await self.page.inner_text(location_selector)
-            self.logger.info(f"Current location text: {location_text}")
+        Args:
+            postcode: Postcode being set
 
-            # Take verification screenshot
-            await self.take_screenshot("05_location_verified")
+        Returns:
+            True if Apply was clicked, False otherwise
+        """
+        self._step_log("Step 5: Clicking Apply button...")
 
-            # Check if the postcode area is in the location text
-            postcode_area = expected_postcode.split()[0]  # Get first part (e.g., "SE1")
+        try:
+            await self.page.wait_for_selector(_APPLY_SELECTOR, timeout=1000)
+            await self.page.click(_APPLY_SELECTOR)
+            self.logger.success("Clicked Apply button")
+        except Exception as e:
+            self.logger.error(f"Failed to click Apply button: {e}")
+            await self.take_screenshot("error_apply_button")
+            return False
 
-            if postcode_area.upper() in location_text.upper():
-                self.logger.success(f"✅ Location change VERIFIED! Location shows: {location_text}")
-                return True
-            else:
-                self.logger.warning(f"⚠️  Location text does not contain expected postcode. Got: {location_text}")
-                # Still might be successful, just different format
-                return True
+        # Wait for Amazon to react to Apply instead of sleeping a fixed time
+        postcode_area = postcode.split()[0].upper()
+        try:
+            await self.page.wait_for_function(_LOCATION_APPLIED_JS, arg=postcode_area, timeout=8000)
+        except Exception:
+            self.logger.warning("No response to Apply yet, checking for Continue/Done anyway")
+        return True
+
+    async def _location_confirm(self) -> None:
+        """Step 6: Click the Continue/Done button if Amazon shows one (optional)."""
+        self._step_log("Step 6: Checking for Continue/Done button...")
+
+        # One wait on the whole selector list resolves as soon as any
+        # button shows up, instead of timing out on each in turn
+        try:
+            button = self.page.locator(f"{_CONTINUE_SELECTOR} >> visible=true").first
+            await button.wait_for(timeout=3000)
+            await button.click()
+            self.logger.success("Clicked Continue/Done button")
+        except Exception:
+            self.logger.info("No Continue/Done button shown")
+
+        await self.take_screenshot("04_after_apply")
+
+    async def _verify_location_change(self, expected_postcode: str) -> bool:
+        """
+        Verify that the location was actually changed.
+
+        Args:
+            expected_postcode: The postcode that should be set
 
+        Returns:
+            True if location is verified, False otherwise
+        """
+        postcode_area = expected_postcode.split()[0]  # Get first part (e.g., "SE1")
+
+        # Wait for the header to show the postcode area - checked in the page,
+        # so the happy path never copies the location text over the wire
+        try:
+            await self.page.wait_for_function(_LOCATION_SHOWN_JS, arg=postcode_area.upper(), timeout=10000)
+            await self.take_screenshot("05_location_verified")
+            self.logger.success(f"✅ Location change VERIFIED! Location shows: {postcode_area}")
+            return True
+        except Exception:
+            pass
+
+        # No match - read the text for the log (fails if the header is missing)
+        try:
+            location_text = await self.page.inner_text(_LOCATION_LINE_SELECTOR, timeout=2000)
         except Exception as e:
             self.logger.error(f"Could not verify location change: {e}")
             return False
 
-    async def _click_subscribe_and_save(self) -> bool:
+        self.logger.info(f"Current location text: {location_text}")
+
+        # Take verification screenshot
+        await self.take_screenshot("05_location_verified")
+
+        self.logger.warning(f"⚠️  Location text does not contain expected postcode. Got: {location_text}")
+        # Still might be successful, just different format
+        return True
+
+    async def _click_subscribe_and_save(self, page: Optional[Page] = None) -> bool:
         """
         Attempt to click the Subscribe & Save option if it exists on the page.
         This is crucial for revealing the Subscribe & Save price.
 
+        Args:
+            page: Page to act on (defaults to the scraper's main page)
+
         Returns:
             True if clicked successfully, False otherwise
         """
+        page = page or self.page
+
         try:
-            self.logger.info("Looking for Subscribe & Save option...")
-
-            # Common selectors for Subscribe & Save button/radio
-            # Try radio buttons first, then labels
-            subscribe_selectors = [
-                # Radio button inputs
-                "#rcxsubsync_dealPrice_feature_div input[type='radio']",
-                "input#rcxsubsRadioButton",
-                "#subscribe-and-save-radio-button",
-                "input[name='submit.addToCart'][value*='subscribe']",
-                # Labels (more reliable for clicking)
-                "#rcxsubsync_dealPrice_feature_div label",
-                "label[for='rcxsubsRadioButton']",
-                "label[for='subscribe-and-save-radio-button']",
-                # Other selectors
-                "[data-action='rc-subscribe-radio-button']",
-                ".rcx-radio__label",
-            ]
-
-            for selector in subscribe_selectors:
-                try:
-                    element = await self.page.wait_for_selector(selector, timeout=1500)
-                    if element:
-                        # Check if it's already selected
-                        if selector.endswith("input[type='radio']") or "RadioButton" in selector:
-                            is_checked = await element.is_checked()
-                            if is_checked:
-                                self.logger.info("Subscribe & Save already selected")
-                                return True
-
-                        # Click the element
-                        await element.click()
-                        self.logger.success(f"✅ Clicked Subscribe & Save option using: {selector}")
-
-                        # Wait for price to update
-                        await asyncio.sleep(0.8)
-                        return True
-                except Exception:
-                    continue
+            self._step_log("Looking for Subscribe & Save option...")
 
-            self.logger.warning("Subscribe & Save option not found (may not be available for this product)")
-            return False
+            # Find, check and click in the page: one polling round-trip instead
+            # of a wait, a state read and a click
+            try:
+                handle = await page.wait_for_function(_SNS_SELECT_JS, timeout=1500)
+            except Exception:
+                self.logger.warning("Subscribe & Save option not found (may not be available for this product)")
+                return False
+            result = await handle.json_value()
+
+            # Check if it's already selected (a label reports its radio's state)
+            if result["state"] == "already":
+                self.logger.debug("Subscribe & Save already selected")
+                return True
+
+            self.logger.debug("✅ Clicked Subscribe & Save option using: %s", result["selector"])
+
+            # Wait for price to update - done as soon as the displayed price changes
+            self._step_log("Waiting for Subscribe & Save price to update...")
+            try:
+                await page.wait_for_function(_PRICE_CHANGED_JS, arg=result["price"], timeout=2000)
+            except Exception:
+                self.logger.debug("Displayed price did not change after selecting Subscribe & Save")
+            return True
 
         except Exception as e:
             self.logger.warning(f"Could not click Subscribe & Save: {e}")
             return False
 
-    async def navigate_to_product(self, url: str, max_retries: int = 3) -> bool:
+    async def navigate_to_product(self, url: str, max_retries: int = 3,
+                                  page: Optional[Page] = None) -> bool:
         """
         Navigate to a specific product URL with retry logic.
 
         Args:
             url: The Amazon product URL
             max_retries: Maximum number of retry attempts
+            page: Page to navigate (defaults to the scraper's main page)
 
         Returns:
             True if navigation successful, False otherwise
         """
-        self.logger.info(f"Navigating to product URL...")
+        page = page or self.page
+        self.logger.debug("Navigating to product URL...")
 
         for attempt in range(1, max_retries + 1):
             try:
-                # Increased timeout to 30 seconds for better reliability
-                await self.page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                # Return as soon as the response commits; the rest of the page
+                # (carousels, recommendations) keeps loading in the background
+                await self._goto(page, url, wait_until="commit", timeout=30000)
 
                 # Wait for product title to appear (means page is ready)
-                await self.page.wait_for_selector("#productTitle", timeout=10000)
+                await page.wait_for_selector("#productTitle", timeout=10000)
 
-                self.logger.success("Product page loaded successfully")
+                # The price containers come after the title in the HTML; wait for
+                # those only (not the whole document), since the snapshot reads them.
+                # Unavailable items may have none, so don't fail navigation over it
+                try:
+                    await page.wait_for_selector(_PRICE_CONTAINER_SELECTOR, state="attached", timeout=5000)
+                except Exception:
+                    self.logger.debug("No price container found, extracting anyway")
+
+                self.logger.debug("Product page loaded successfully")
 
                 # CRITICAL: Try to click Subscribe & Save if available
                 # This must happen BEFORE price extraction to get correct S&S price
-                sns_clicked = await self._click_subscribe_and_save()
+                sns_clicked = await self._click_subscribe_and_save(page)
 
-                if sns_clicked:
-                    # Wait longer for price to fully update after clicking
-                    # Amazon pages often have delayed price updates
-                    await asyncio.sleep(1.2)
-                    self.logger.info("Waiting for Subscribe & Save price to update...")
-                else:
+                if not sns_clicked:
                     # Even if S&S not clicked, wait a bit for page to stabilize
                     await asyncio.sleep(0.5)
 
@@ -343,11 +728,36 @@ class AmazonUKScraper:
         Returns:
             Dictionary containing scraped product data
         """
+        return await self.scrape_product_fast_on_page(self.page, url)
+
+    async def scrape_product_fast_on_page(self, page: Page, url: str) -> Dict[str, Any]:
+        """
+        Scrape a product on an explicit page without initializing/closing browser.
+        Lets concurrent batch workers each drive their own page.
+
+        Args:
+            page: Playwright page to scrape with
+            url: The Amazon product URL to scrape
+
+        Returns:
+            Dictionary containing scraped product data
+        """
+        cached = self._product_cache.get(url)
+        if cached is not None:
+            self.logger.debug("Using cached product data")
+            return cached
+
         try:
             # Navigate to product page
-            nav_success = await self.navigate_to_product(url)
+            nav_success = await self.navigate_to_product(url, page=page)
 
             if not nav_success:
+                if await self._is_captcha_page(page):
+                    self.logger.error("Amazon returned a CAPTCHA challenge")
+                    return {
+                        "error": "CAPTCHA challenge",
+                        "status": "captcha"
+                    }
                 self.logger.error("Failed to navigate to product page")
                 return {
                     "error": "Failed to navigate to product",
@@ -355,8 +765,10 @@ class AmazonUKScraper:
                 }
 
             # Extract product data
-            extractor = ProductExtractor(self.page)
+            extractor = ProductExtractor(page)
             product_data = await extractor.extract_all_product_data(url)
+            if product_data.get("extraction_status") == "success":
+                self._product_cache.put(url, product_data)
 
             return product_data
 
@@ -367,6 +779,72 @@ class AmazonUKScraper:
                 "status": "failed"
             }
 
+    async def scrape_url(self, url: str) -> Dict[str, Any]:
+        """
+        Scrape a product on a fresh page in the shared context.
+        Intended for use inside `async with AmazonUKScraper(...)`.
+
+        Args:
+            url: The Amazon product URL to scrape
+
+        Returns:
+            Dictionary containing scraped product data
+        """
+        cached = self._product_cache.get(url)
+        if cached is not None:
+            self.logger.debug("Using cached product data")
+            return cached
+
+        page = await self.context.new_page()
+        try:
+            return await self.scrape_product_fast_on_page(page, url)
+        finally:
+            await page.close()
+            # Cookies barely change between products, so only persist every N scrapes
+            self._scrapes_since_cookie_save += 1
+            if self._scrapes_since_cookie_save >= self.config.get("cookie_save_interval", 25):
+                self._schedule_cookie_save()
+
+    async def scrape_many(self, urls: List[str], concurrency: int = 5) -> List[Dict[str, Any]]:
+        """
+        Scrape several products in parallel, one page each, in the shared context.
+
+        Args:
+            urls: Amazon product URLs to scrape
+            concurrency: Maximum number of pages open at once
+
+        Returns:
+            Product data dictionaries in the same order as urls
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            # Only ordinary errors become failed results; cancellation propagates
+            try:
+                async with semaphore:
+                    return await self.scrape_url(url)
+            except Exception as e:
+                return {"url": url, "error": str(e), "status": "failed"}
+
+        return list(await asyncio.gather(*(scrape_one(url) for url in urls)))
+
+    async def _is_captcha_page(self, page: Page) -> bool:
+        """
+        Check whether Amazon served its bot-check page instead of the product.
+
+        Args:
+            page: Page to inspect
+
+        Returns:
+            True if the page is a CAPTCHA challenge, False otherwise
+        """
+        try:
+            return await page.evaluate(
+                "() => !!document.querySelector(\"form[action*='validateCaptcha'], #captchacharacters\")"
+            )
+        except Exception:
+            return False
+
     async def scrape_product(self, url: str) -> Dict[str, Any]:
         """
         Main method to scrape a product from Amazon UK.
@@ -395,10 +873,8 @@ class AmazonUKScraper:
             extractor = ProductExtractor(self.page)
             product_data = await extractor.extract_all_product_data(url)
 
-            # Save cookies for future use
-            if self.config.get("save_cookies", True):
-                cookies = await self.context.cookies()
-                save_cookies(cookies)
+            # Save cookies for future use, without holding up the result
+            self._schedule_cookie_save()
 
             return product_data
 
@@ -422,6 +898,20 @@ class AmazonUKScraper:
     async def close(self) -> None:
         """Clean up browser resources."""
         try:
+            if self._screenshot_tasks:
+                await asyncio.gather(*self._screenshot_tasks, return_exceptions=True)
+            if self._cookie_task and not self._cookie_task.done():
+                try:
+                    await asyncio.wait_for(self._cookie_task, timeout=5)
+                except asyncio.TimeoutError:
+                    self.logger.warning("Timed out saving cookies")
+            if self._cookie_save_pending and self.context:
+                # A save requested mid-write was skipped; take the final snapshot now
+                self._cookie_save_pending = False
+                await self._persist_cookies()
+            await asyncio.to_thread(flush_cookies)
+            if self.page_pool:
+                await self.page_pool.close()
             if self.page:
                 await self.page.close()
             if self.context:
@@ -3,61 +3,227 @@ Utility functions for Amazon UK scraper.
 Provides helper functions for logging, file operations, and data formatting.
 """
 
+import functools
 import json
+import os
 import random
 import asyncio
-from datetime import datetime
+import atexit
+import copy
+import sys
+import threading
+import time
+import unicodedata
+import weakref
 from pathlib import Path
-from typing import Any, Dict, Optional
-from tabulate import tabulate
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from playwright.async_api import Page
+
+# orjson is optional: it serializes straight to bytes and parses several
+# times faster than the stdlib, which is used as the fallback
+try:
+    import orjson
+
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_record(data: Any) -> bytes:
+        return orjson.dumps(data, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+    def _dumps_record(data: Any) -> bytes:
+        return json.dumps(data, ensure_ascii=False, default=str).encode("utf-8")
+
+    _loads = json.loads
+
+# Pending lines while Logger output is buffered, written once this many accumulate
+_log_buf: List[str] = []
+_LOG_BUF_LINES = 64
+
+
+def flush_logs() -> None:
+    """Write any buffered log lines to stdout in one call."""
+    if _log_buf:
+        sys.stdout.write("\n".join(_log_buf) + "\n")
+        _log_buf.clear()
+        sys.stdout.flush()
+
+
+atexit.register(flush_logs)
+
+# Console separators shared by the CLI scripts
+BAR = "=" * 80
+DASH = "-" * 80
+
+# (epoch second, formatted timestamp) of the last log line
+_ts_cache = [0, ""]
+
+
+def _ts() -> str:
+    """
+    Get the log timestamp for the current second, formatting it at most once per second.
+
+    Returns:
+        Local time formatted as 'YYYY-MM-DD HH:MM:SS'
+    """
+    t = int(time.time())
+    if t != _ts_cache[0]:
+        _ts_cache[:] = [t, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(t))]
+    return _ts_cache[1]
 
 
 class Logger:
     """Simple logger for tracking scraper progress."""
 
+    # Level prefixes with and without emoji (plain output suits consoles
+    # that can't render them, e.g. legacy Windows terminals)
+    _PREFIXES = {
+        "info": ("ℹ️  INFO:", "[INFO]"),
+        "success": ("✅ SUCCESS:", "[SUCCESS]"),
+        "error": ("❌ ERROR:", "[ERROR]"),
+        "warning": ("⚠️  WARNING:", "[WARNING]"),
+        "debug": ("🔍 DEBUG:", "[DEBUG]"),
+    }
+    _emoji = True
+    _verbose = False
+    _buffered = False
+
+    @classmethod
+    def configure(cls, emoji: Optional[bool] = None, verbose: Optional[bool] = None,
+                  buffered: Optional[bool] = None) -> None:
+        """
+        Configure log output for every Logger in the process.
+        Options left as None keep their current value.
+
+        Args:
+            emoji: Prefix messages with emoji (True) or plain [LEVEL] tags (False)
+            verbose: Show debug messages (off by default)
+            buffered: Collect lines and write them to stdout in batches (see flush_logs)
+        """
+        if emoji is not None:
+            cls._emoji = emoji
+        if verbose is not None:
+            cls._verbose = verbose
+        if buffered is not None:
+            if not buffered:
+                flush_logs()
+            cls._buffered = buffered
+
+    @classmethod
+    def _emit(cls, level: str, message: str, args: tuple = ()) -> None:
+        """
+        Print a timestamped message with the prefix for its level.
+
+        Args:
+            level: One of 'info', 'success', 'error', 'warning', 'debug'
+            message: The message to log, optionally with %-style placeholders
+            args: Values substituted into the message
+        """
+        if args:
+            message = message % args
+        prefix = cls._PREFIXES[level][0 if cls._emoji else 1]
+        line = f"[{_ts()}] {prefix} {message}"
+        if not cls._buffered:
+            print(line)
+            return
+
+        _log_buf.append(line)
+        if level == "error" or len(_log_buf) >= _LOG_BUF_LINES:
+            flush_logs()
+
     @staticmethod
-    def info(message: str) -> None:
+    def info(message: str, *args: Any) -> None:
         """
         Log an informational message.
 
         Args:
-            message: The message to log
+            message: The message to log, optionally with %-style placeholders
+            *args: Values substituted into the message
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] ℹ️  INFO: {message}")
+        Logger._emit("info", message, args)
 
     @staticmethod
-    def success(message: str) -> None:
+    def success(message: str, *args: Any) -> None:
         """
         Log a success message.
 
         Args:
-            message: The message to log
+            message: The message to log, optionally with %-style placeholders
+            *args: Values substituted into the message
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] ✅ SUCCESS: {message}")
+        Logger._emit("success", message, args)
 
     @staticmethod
-    def error(message: str) -> None:
+    def error(message: str, *args: Any) -> None:
         """
         Log an error message.
 
         Args:
-            message: The message to log
+            message: The message to log, optionally with %-style placeholders
+            *args: Values substituted into the message
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] ❌ ERROR: {message}")
+        Logger._emit("error", message, args)
 
     @staticmethod
-    def warning(message: str) -> None:
+    def warning(message: str, *args: Any) -> None:
         """
         Log a warning message.
 
         Args:
-            message: The message to log
+            message: The message to log, optionally with %-style placeholders
+            *args: Values substituted into the message
         """
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        print(f"[{timestamp}] ⚠️  WARNING: {message}")
+        Logger._emit("warning", message, args)
+
+    @staticmethod
+    def debug(message: str, *args: Any) -> None:
+        """
+        Log a debug message (only shown when verbose output is enabled).
+        Pass values as %-style args so formatting is skipped when hidden.
+
+        Args:
+            message: The message to log, optionally with %-style placeholders
+            *args: Values substituted into the message
+        """
+        if Logger._verbose:
+            Logger._emit("debug", message, args)
+
+
+@functools.lru_cache(maxsize=1)
+def get_logger() -> Logger:
+    """
+    Get the process-wide Logger instance.
+
+    Returns:
+        Shared Logger, created on first use
+    """
+    return Logger()
+
+
+def use_fast_event_loop() -> None:
+    """
+    Switch asyncio to uvloop's event loop policy where it is available.
+    Must be called before asyncio.run(); a no-op on Windows or without uvloop.
+    """
+    if sys.platform == "win32":
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        return
+
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+# Dedicated generator for delays, independent of the shared module-level random state
+_rng = random.Random()
 
 
 async def random_delay(min_seconds: float = 2.0, max_seconds: float = 4.0) -> None:
@@ -68,8 +234,63 @@ async def random_delay(min_seconds: float = 2.0, max_seconds: float = 4.0) -> No
         min_seconds: Minimum delay in seconds
         max_seconds: Maximum delay in seconds
     """
-    delay = random.uniform(min_seconds, max_seconds)
-    await asyncio.sleep(delay)
+    await asyncio.sleep(_rng.uniform(min_seconds, max_seconds))
+
+
+def random_delays(n: int, min_seconds: float = 2.0, max_seconds: float = 4.0) -> List[float]:
+    """
+    Draw several random delays at once, e.g. to schedule a batch of staggered starts.
+
+    Args:
+        n: Number of delays
+        min_seconds: Minimum delay in seconds
+        max_seconds: Maximum delay in seconds
+
+    Returns:
+        List of n delays in seconds
+    """
+    uniform = _rng.uniform
+    return [uniform(min_seconds, max_seconds) for _ in range(n)]
+
+
+_DATA_DIR = Path("data")
+
+# Directories already created by this process, so repeat saves skip the mkdir
+_ready_dirs: set = set()
+
+
+def _ensure_dir(directory: Path) -> None:
+    """
+    Create a directory the first time it is needed in this process.
+
+    Args:
+        directory: Directory to create if it doesn't exist
+    """
+    if directory not in _ready_dirs:
+        directory.mkdir(exist_ok=True)
+        _ready_dirs.add(directory)
+
+
+# innerText of the first match for each selector (null where nothing matches)
+_BATCH_QUERY_JS = """(sels) => sels.map(s => {
+    const el = document.querySelector(s);
+    return el ? el.innerText : null;
+})"""
+
+
+async def batch_query(page: "Page", selectors: List[str]) -> Dict[str, Optional[str]]:
+    """
+    Look up several selectors in one page round-trip.
+
+    Args:
+        page: Playwright page to query
+        selectors: CSS selectors to check
+
+    Returns:
+        Dictionary of selector -> text of its first match, or None if nothing matched
+    """
+    texts = await page.evaluate(_BATCH_QUERY_JS, list(selectors))
+    return dict(zip(selectors, texts))
 
 
 def save_to_json(data: Dict[str, Any], filename: Optional[str] = None) -> str:
@@ -84,25 +305,177 @@ def save_to_json(data: Dict[str, Any], filename: Optional[str] = None) -> str:
         Path to the saved file
     """
     if filename is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         filename = f"amazon_product_{timestamp}.json"
 
     # Ensure data directory exists
-    data_dir = Path("data")
-    data_dir.mkdir(exist_ok=True)
+    _ensure_dir(_DATA_DIR)
 
-    filepath = data_dir / filename
+    filepath = _DATA_DIR / filename
 
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, ensure_ascii=False)
+    # Serialize up front so the file gets one write instead of one per token
+    data_bytes = _dumps(data)
+    with open(filepath, "wb") as f:
+        f.write(data_bytes)
 
     return str(filepath)
 
 
+# Caps concurrent background JSON writes; one semaphore per event loop, since
+# a semaphore stays bound to the loop it was first used in
+_SAVE_CONCURRENCY = 8
+_save_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = \
+    weakref.WeakKeyDictionary()
+
+
+async def save_to_json_async(data: Dict[str, Any], filename: Optional[str] = None) -> str:
+    """
+    Save data to a JSON file without blocking the event loop.
+
+    Runs save_to_json in a worker thread, with at most eight writes in
+    flight at once.
+
+    Args:
+        data: Dictionary containing the data to save
+        filename: Optional custom filename
+
+    Returns:
+        Path to the saved file
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _save_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _save_semaphores[loop] = asyncio.Semaphore(_SAVE_CONCURRENCY)
+    async with semaphore:
+        return await asyncio.to_thread(save_to_json, data, filename)
+
+
+class JsonArrayWriter:
+    """
+    Write a JSON array to disk one record at a time.
+
+    Records are serialized and written as they are added, so peak memory
+    doesn't grow with the number of records. Use as a context manager; the
+    closing bracket is written on exit.
+    """
+
+    def __init__(self, filepath: str):
+        """
+        Initialize the writer.
+
+        Args:
+            filepath: Path of the JSON file to create (overwritten if it exists)
+        """
+        self.filepath = filepath
+        self._file = None
+        self._first = True
+
+    def __enter__(self) -> "JsonArrayWriter":
+        self._file = open(self.filepath, "wb")
+        self._file.write(b"[\n")
+        self._first = True
+        return self
+
+    def write(self, record: Dict[str, Any]) -> None:
+        """
+        Append one record to the array.
+
+        Args:
+            record: JSON-serializable dictionary (other values are written as strings)
+        """
+        if not self._first:
+            self._file.write(b",\n")
+        self._file.write(_dumps_record(record))
+        self._first = False
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._file.write(b"\n]\n")
+        self._file.close()
+        self._file = None
+
+
+def save_products_hc(products: List[Dict[str, Any]], filepath: str) -> str:
+    """
+    Save same-shaped product dictionaries in a compact homogeneous-collection layout.
+
+    The file holds one flat array, [n_keys, *keys, *values]: the keys once,
+    then each product's values in key order. Repeated keys are dropped,
+    which shrinks large batch dumps considerably. Keys missing from a
+    product are stored as null. Read it back with load_products_hc().
+
+    Args:
+        products: Product dictionaries (normally sharing the same keys)
+        filepath: Path of the JSON file to write
+
+    Returns:
+        Path to the saved file
+    """
+    keys: Dict[str, None] = {}
+    for product in products:
+        keys.update(dict.fromkeys(product))
+    layout: List[Any] = [len(keys), *keys]
+    for product in products:
+        layout.extend(product.get(key) for key in keys)
+
+    data_bytes = _dumps_record(layout)
+    with open(filepath, "wb") as f:
+        f.write(data_bytes)
+    return str(filepath)
+
+
+def load_products_hc(filepath: str) -> List[Dict[str, Any]]:
+    """
+    Load products written by save_products_hc().
+
+    Args:
+        filepath: Path of the homogeneous-collection JSON file
+
+    Returns:
+        List of product dictionaries
+    """
+    layout = _loads(Path(filepath).read_bytes())
+    n_keys = layout[0]
+    keys = layout[1:n_keys + 1]
+    values = layout[n_keys + 1:]
+    if not n_keys:
+        return []
+    return [dict(zip(keys, values[i:i + n_keys])) for i in range(0, len(values), n_keys)]
+
+
+# Parsed config files: path -> (st_mtime_ns, config)
+_cfg_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+
+
+def _read_config(config_path: str) -> Dict[str, Any]:
+    """
+    Parse a configuration file, reusing the last parse while its mtime is unchanged.
+
+    Failures raise and are therefore not cached.
+
+    Args:
+        config_path: Path to the configuration file
+
+    Returns:
+        Dictionary containing configuration data
+    """
+    mtime = os.stat(config_path).st_mtime_ns
+    entry = _cfg_cache.get(config_path)
+    if entry and entry[0] == mtime:
+        return entry[1]
+
+    config = _loads(Path(config_path).read_bytes())
+    _cfg_cache[config_path] = (mtime, config)
+    return config
+
+
 def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
     """
     Load configuration from JSON file.
 
+    The parsed file is cached per path until it is modified; each caller gets
+    its own deep copy so mutating the result (including nested values such as
+    `viewport` or `browser_args`) never leaks into later calls.
+
     Args:
         config_path: Path to the configuration file
 
@@ -110,8 +483,7 @@ def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
         Dictionary containing configuration data
     """
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return copy.deepcopy(_read_config(config_path))
     except FileNotFoundError:
         Logger.error(f"Configuration file not found: {config_path}")
         return {}
@@ -120,18 +492,92 @@ def load_config(config_path: str = "config/config.json") -> Dict[str, Any]:
         return {}
 
 
+class _CookieBuffer:
+    """Holds the latest cookies for one file and writes them at most every `interval` seconds."""
+
+    def __init__(self, filepath: str, interval: float = 30.0):
+        """
+        Initialize the cookie buffer.
+
+        Args:
+            filepath: Path the cookies are written to
+            interval: Minimum seconds between writes (flush(force=True) ignores it)
+        """
+        self.filepath = filepath
+        self.interval = interval
+        self.pending: Optional[list] = None
+        self.last_flush = 0.0
+        self._written: Optional[list] = None
+        self._lock = threading.Lock()
+
+    def update(self, cookies: list) -> None:
+        """
+        Replace the pending cookies; unchanged cookies leave the buffer clean.
+
+        Args:
+            cookies: List of cookie dictionaries
+        """
+        with self._lock:
+            self.pending = None if cookies == self._written else cookies
+
+    def flush(self, force: bool = False) -> None:
+        """
+        Write the pending cookies if there are any and the interval has passed.
+
+        Args:
+            force: Write regardless of the time since the last flush
+        """
+        with self._lock:
+            if self.pending is None:
+                return
+            if not force and time.monotonic() - self.last_flush < self.interval:
+                return
+            cookies, self.pending = self.pending, None
+            _ensure_dir(Path(self.filepath).parent)
+            data_bytes = _dumps(cookies)
+            # Write beside the target and swap it in, so an interrupted save
+            # never leaves a truncated cookie file behind
+            tmp = Path(self.filepath).with_suffix(".json.tmp")
+            with open(tmp, "wb") as f:
+                f.write(data_bytes)
+            os.replace(tmp, self.filepath)
+            self._written = cookies
+            self.last_flush = time.monotonic()
+        Logger.info(f"Cookies saved to {self.filepath}")
+
+
+_cookie_buffers: Dict[str, _CookieBuffer] = {}
+
+
+def flush_cookies() -> None:
+    """Write any buffered cookies to disk now."""
+    for buf in list(_cookie_buffers.values()):
+        try:
+            buf.flush(force=True)
+        except Exception as e:
+            Logger.warning(f"Could not save cookies to {buf.filepath}: {e}")
+
+
+# Don't lose buffered cookies if the process exits without closing the scraper
+atexit.register(flush_cookies)
+
+
 def save_cookies(cookies: list, filepath: str = "config/cookies.json") -> None:
     """
     Save browser cookies to a file.
 
+    Writes are buffered: the file is rewritten at most every 30 seconds and
+    only when the cookies changed. Call flush_cookies() to write immediately.
+
     Args:
         cookies: List of cookie dictionaries
         filepath: Path to save cookies
     """
-    Path(filepath).parent.mkdir(exist_ok=True)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(cookies, f, indent=2)
-    Logger.info(f"Cookies saved to {filepath}")
+    buf = _cookie_buffers.get(filepath)
+    if buf is None:
+        buf = _cookie_buffers[filepath] = _CookieBuffer(filepath)
+    buf.update(cookies)
+    buf.flush()
 
 
 def load_cookies(filepath: str = "config/cookies.json") -> Optional[list]:
@@ -144,24 +590,148 @@ def load_cookies(filepath: str = "config/cookies.json") -> Optional[list]:
     Returns:
         List of cookie dictionaries or None if file doesn't exist
     """
+    path = Path(filepath)
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            cookies = json.load(f)
-        Logger.info(f"Cookies loaded from {filepath}")
-        return cookies
+        raw = path.read_bytes()
     except FileNotFoundError:
         Logger.warning(f"Cookie file not found: {filepath}")
         return None
+
+    # An empty file holds no cookies; skip the parser and its error path
+    if len(raw.strip()) < 2:
+        Logger.warning(f"Cookie file is empty: {filepath}")
+        return None
+
+    try:
+        cookies = _loads(raw)
     except json.JSONDecodeError as e:
         Logger.error(f"Corrupted cookie file detected: {e}. Deleting and starting fresh.")
         # Delete the corrupted file
         try:
-            Path(filepath).unlink()
+            path.unlink(missing_ok=True)
             Logger.info(f"Deleted corrupted cookie file: {filepath}")
-        except Exception:
+        except OSError:
             pass
         return None
 
+    Logger.info(f"Cookies loaded from {filepath}")
+    return cookies
+
+
+def load_location_cache(filepath: str = "config/postcode_cache.json") -> Dict[str, str]:
+    """
+    Load the map of cookie session keys to the postcode set for that session.
+
+    Args:
+        filepath: Path to the postcode cache file
+
+    Returns:
+        Dictionary of session key -> postcode (empty if missing or unreadable)
+    """
+    try:
+        return _loads(Path(filepath).read_bytes())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_location_cache(session_key: str, postcode: str,
+                        filepath: str = "config/postcode_cache.json") -> None:
+    """
+    Remember the postcode set for a cookie session.
+
+    Args:
+        session_key: Key identifying the cookie session
+        postcode: Postcode the session's delivery location was set to
+        filepath: Path to the postcode cache file
+    """
+    cache = load_location_cache(filepath)
+    cache[session_key] = postcode
+    _ensure_dir(Path(filepath).parent)
+    with open(filepath, "wb") as f:
+        f.write(_dumps(cache))
+
+
+def _display_width(text: str) -> int:
+    """
+    Width of a string in terminal columns (wide characters such as emoji count twice).
+
+    Args:
+        text: String to measure
+
+    Returns:
+        Number of columns the string occupies
+    """
+    if text.isascii():
+        return len(text)
+    width = 0
+    for ch in text:
+        if ch == "\ufe0f":
+            # Emoji presentation selector: the preceding symbol renders double-width
+            width += 1
+            continue
+        if unicodedata.combining(ch) or unicodedata.category(ch) in ("Mn", "Me", "Cf"):
+            continue
+        width += 2 if unicodedata.east_asian_width(ch) in ("W", "F") else 1
+    return width
+
+
+def _grid_table(rows: list, headers: tuple) -> str:
+    """
+    Render two-column rows as a grid table (the same layout as tabulate's "grid" format).
+
+    Args:
+        rows: List of [field, value] pairs
+        headers: Column headings
+
+    Returns:
+        The table as a multi-line string
+    """
+    cells = [(str(k), str(v)) for k, v in rows]
+    key_width = max([_display_width(headers[0])] + [_display_width(k) for k, _ in cells])
+    value_width = max([_display_width(headers[1])] + [_display_width(v) for _, v in cells])
+
+    def row(k: str, v: str) -> str:
+        return f"| {k}{' ' * (key_width - _display_width(k))} | {v}{' ' * (value_width - _display_width(v))} |"
+
+    border = f"+{'-' * (key_width + 2)}+{'-' * (value_width + 2)}+"
+    lines = [border, row(*headers), f"+{'=' * (key_width + 2)}+{'=' * (value_width + 2)}+"]
+    for k, v in cells:
+        lines.append(row(k, v))
+        lines.append(border)
+    if not cells:
+        lines.append(border)
+    return "\n".join(lines)
+
+
+# Results table rows, in display order; any other fields follow these
+_FIELD_ORDER = (
+    "product_title",
+    "price",
+    "price_type",
+    "stock_status",
+    "stock_quantity",
+    "stock_message",
+    "extraction_status"
+)
+_FIELD_ORDER_SET = frozenset(_FIELD_ORDER)
+
+# Fields shown below the table instead of in it
+_EXCLUDE_DISPLAY = frozenset({"timestamp", "url"})
+
+
+@functools.lru_cache(maxsize=None)
+def _display_key(key: str) -> str:
+    """
+    Turn a product field name into its table label, e.g. 'stock_status' -> 'Stock Status'.
+
+    Args:
+        key: Product dictionary key
+
+    Returns:
+        Human-readable label (memoized; product dicts share a small fixed set of keys)
+    """
+    return key.replace("_", " ").title()
+
 
 def display_results_table(data: Dict[str, Any]) -> None:
     """
@@ -170,28 +740,17 @@ def display_results_table(data: Dict[str, Any]) -> None:
     Args:
         data: Dictionary containing product data
     """
-    print("\n" + "=" * 80)
+    print("\n" + BAR)
     print("SCRAPING RESULTS".center(80))
-    print("=" * 80 + "\n")
+    print(BAR + "\n")
 
     table_data = []
 
-    # Custom ordering for better readability
-    field_order = [
-        "product_title",
-        "price",
-        "price_type",
-        "stock_status",
-        "stock_quantity",
-        "stock_message",
-        "extraction_status"
-    ]
-
     # Add ordered fields first
-    for key in field_order:
+    for key in _FIELD_ORDER:
         if key in data:
             value = data[key]
-            display_key = key.replace("_", " ").title()
+            display_key = _display_key(key)
 
             # Special formatting for stock status
             if key == "stock_status":
@@ -212,11 +771,10 @@ def display_results_table(data: Dict[str, Any]) -> None:
 
     # Add any remaining fields not in the ordered list
     for key, value in data.items():
-        if key not in field_order and key != "timestamp" and key != "url":
-            display_key = key.replace("_", " ").title()
-            table_data.append([display_key, value if value else "N/A"])
+        if key not in _FIELD_ORDER_SET and key not in _EXCLUDE_DISPLAY:
+            table_data.append([_display_key(key), value if value else "N/A"])
 
-    print(tabulate(table_data, headers=["Field", "Value"], tablefmt="grid"))
+    print(_grid_table(table_data, ("Field", "Value")))
 
     # Display additional info
     if "timestamp" in data:
@@ -224,14 +782,14 @@ def display_results_table(data: Dict[str, Any]) -> None:
     if "url" in data:
         print(f"Product URL: {data['url']}")
 
-    print("\n" + "=" * 80 + "\n")
+    print("\n" + BAR + "\n")
 
 
+@functools.lru_cache(maxsize=1)
 def ensure_directories() -> None:
-    """Create necessary directories if they don't exist."""
-    directories = ["data", "screenshots", "config"]
-    for directory in directories:
-        Path(directory).mkdir(exist_ok=True)
+    """Create necessary directories if they don't exist (once per process)."""
+    for directory in (_DATA_DIR, Path("screenshots"), Path("config")):
+        _ensure_dir(directory)
     Logger.info("Directory structure verified")
 
 
@@ -248,6 +806,6 @@ def format_price(price_text: Optional[str]) -> Optional[str]:
     if not price_text:
         return None
 
-    # Remove extra whitespace and newlines
-    price_text = " ".join(price_text.split())
-    return price_text.strip()
+    # Collapse whitespace and newlines; split() already drops leading/trailing
+    # whitespace, and beats a regex sub on short price strings like these
+    return " ".join(price_text.split())
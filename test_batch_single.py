@@ -4,44 +4,24 @@ Test batch scraping with a single product to verify the price fix.
 
 import asyncio
 import sys
-import pandas as pd
 from pathlib import Path
 
-# Monkey patch the logger to avoid emoji issues
-from src import utils
-
-class SimpleLogger:
-    @staticmethod
-    def info(msg):
-        print(f"[INFO] {msg}")
-
-    @staticmethod
-    def success(msg):
-        print(f"[SUCCESS] {msg}")
-
-    @staticmethod
-    def error(msg):
-        print(f"[ERROR] {msg}")
-
-    @staticmethod
-    def warning(msg):
-        print(f"[WARNING] {msg}")
-
-# Replace the emoji logger
-utils.Logger = SimpleLogger
-
 from src.scraper import AmazonUKScraper
+from src.utils import BAR, Logger
+
+# Plain [LEVEL] prefixes avoid emoji encoding issues on some consoles
+Logger.configure(emoji=False)
 
 async def test_batch():
     """Test batch scraping with the problematic product."""
 
     test_url = "https://amazon.co.uk/dp/B0CVXSY9YS"
 
-    print("\n" + "="*80)
+    print("\n" + BAR)
     print("TESTING BATCH SCRAPING WITH SINGLE PRODUCT")
-    print("="*80)
+    print(BAR)
     print(f"URL: {test_url}")
-    print("="*80 + "\n")
+    print(BAR + "\n")
 
     config = {
         "headless": False,
@@ -61,12 +41,12 @@ async def test_batch():
         product_data = await scraper.scrape_product_fast(test_url)
 
         # Display results
-        print("\n" + "="*80)
+        print("\n" + BAR)
         print("EXTRACTED DATA (BATCH MODE)")
-        print("="*80)
+        print(BAR)
         for key, value in product_data.items():
             print(f"{key}: {value}")
-        print("="*80)
+        print(BAR)
 
         # Check if price is correct
         extracted_price = product_data.get('price', '')
@@ -3,25 +3,11 @@ Test both problematic products to ensure fixes work.
 """
 
 import asyncio
-from src import utils
-
-class SimpleLogger:
-    @staticmethod
-    def info(msg):
-        print(f"[INFO] {msg}")
-    @staticmethod
-    def success(msg):
-        print(f"[SUCCESS] {msg}")
-    @staticmethod
-    def error(msg):
-        print(f"[ERROR] {msg}")
-    @staticmethod
-    def warning(msg):
-        print(f"[WARNING] {msg}")
-
-utils.Logger = SimpleLogger
-
 from src.scraper import AmazonUKScraper
+from src.utils import BAR, Logger
+
+# Plain [LEVEL] prefixes avoid emoji encoding issues on some consoles
+Logger.configure(emoji=False)
 
 async def test_both_products():
     """Test both problematic products."""
@@ -41,9 +27,9 @@ async def test_both_products():
         }
     ]
 
-    print("\n" + "="*80)
+    print("\n" + BAR)
     print("TESTING BOTH PROBLEMATIC PRODUCTS")
-    print("="*80 + "\n")
+    print(BAR + "\n")
 
     config = {"headless": False, "use_cookies": True, "save_cookies": True}
     scraper = AmazonUKScraper(config)
@@ -51,18 +37,20 @@ async def test_both_products():
     results = []
 
     try:
-        await scraper.initialize_browser()
+        # Borrow pages from the same pool the batch scraper uses
+        await scraper.initialize_browser(pool_size=1)
 
         for idx, product in enumerate(test_products, 1):
-            print(f"\n{'='*80}")
+            print(f"\n{BAR}")
             print(f"TEST {idx}/2: {product['name']}")
-            print("="*80)
+            print(BAR)
             print(f"URL: {product['url']}")
             print(f"Expected: {product['expected']}, Should NOT be: {product['wrong']}")
-            print("="*80 + "\n")
+            print(BAR + "\n")
 
             # Scrape the product
-            product_data = await scraper.scrape_product_fast(product['url'])
+            async with scraper.page_pool.page() as page:
+                product_data = await scraper.scrape_product_fast_on_page(page, product['url'])
 
             # Check result
             extracted_price = product_data.get('price', '')
@@ -82,13 +70,13 @@ async def test_both_products():
         await scraper.close()
 
     # Summary
-    print("\n" + "="*80)
+    print("\n" + BAR)
     print("TEST SUMMARY")
-    print("="*80)
+    print(BAR)
     for status, name, price in results:
         status_emoji = {"PASS": "[SUCCESS]", "FAIL": "[ERROR]", "WARN": "[WARNING]"}[status]
         print(f"{status_emoji} {name}: {price}")
-    print("="*80 + "\n")
+    print(BAR + "\n")
 
     pass_count = sum(1 for r in results if r[0] == "PASS")
     print(f"\nPassed: {pass_count}/{len(results)}")
@@ -5,7 +5,7 @@ This will help us identify exactly what prices are being found.
 
 import asyncio
 from src.scraper import AmazonUKScraper
-from src.utils import Logger, load_config, ensure_directories
+from src.utils import BAR, Logger, batch_query, load_config, ensure_directories, flush_logs
 
 async def debug_single_product():
     """Test scraping a single product with detailed debugging."""
@@ -13,10 +13,12 @@ async def debug_single_product():
     # The problematic product URL
     test_url = "https://amazon.co.uk/dp/B08Q9TR12P"
 
+    # Buffer the many per-selector log lines; flushed before each direct print
+    Logger.configure(buffered=True)
     logger = Logger()
-    print("\n" + "=" * 80)
+    print("\n" + BAR)
     print("SINGLE PRODUCT DEBUG TEST".center(80))
-    print("=" * 80 + "\n")
+    print(BAR + "\n")
 
     logger.info(f"Testing URL: {test_url}")
 
@@ -28,6 +30,7 @@ async def debug_single_product():
     if not config:
         logger.error("Failed to load configuration")
         return
+    config["screenshots"] = True  # this script exists to produce debug screenshots
 
     # Create scraper
     scraper = AmazonUKScraper(config)
@@ -97,16 +100,16 @@ async def debug_single_product():
             "#rcxsubsync_dealPrice_feature_div",
         ]
 
-        for selector in sns_selectors:
-            try:
-                element = await scraper.page.query_selector(selector)
-                if element:
-                    text = await element.inner_text()
+        try:
+            # One in-page lookup for every selector instead of a round-trip each
+            found = await batch_query(scraper.page, sns_selectors)
+            for selector, text in found.items():
+                if text is not None:
                     logger.success(f"  ✅ Found {selector}: {text[:100]}")
                 else:
                     logger.warning(f"  ❌ Not found: {selector}")
-            except Exception as e:
-                logger.error(f"  ❌ Error with {selector}: {e}")
+        except Exception as e:
+            logger.error(f"  ❌ Error checking S&S selectors: {e}")
 
         # Take final screenshot
         await scraper.take_screenshot("debug_03_final")
@@ -114,15 +117,17 @@ async def debug_single_product():
         logger.info("\n--- FINAL EXTRACTION ---")
         product_data = await extractor.extract_all_product_data(test_url)
 
-        print("\n" + "=" * 80)
+        flush_logs()
+        print("\n" + BAR)
         print("FINAL EXTRACTED DATA".center(80))
-        print("=" * 80)
+        print(BAR)
         for key, value in product_data.items():
             print(f"{key}: {value}")
-        print("=" * 80 + "\n")
+        print(BAR + "\n")
 
     except Exception as e:
         logger.error(f"Test failed: {e}")
+        flush_logs()
         import traceback
         traceback.print_exc()
 
@@ -130,6 +135,7 @@ async def debug_single_product():
         # Close browser
         await scraper.close()
         logger.info("Test completed!")
+        flush_logs()
 
 if __name__ == "__main__":
     asyncio.run(debug_single_product())